@@ -0,0 +1,82 @@
+"""Freeze past talks older than a cutoff into the read-only archive snapshot.
+
+Usage: python archive_talks.py [--older-than-days N | --before YYYY-MM-DD] [--config mkdocs.yml] [--prune]
+
+Archived talks are stored with their parsed fields, generated Markdown and
+pre-rendered HTML in ``archive.json`` next to the schedule. Builds load that
+file in one read and skip the matching schedule entries and talk pages, so
+their cost tracks recent talks only. ``--prune`` also removes the archived
+entries from the schedule file (comments in that file are not preserved).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List
+
+import yaml
+from mkdocs.config import load_config
+
+import macros
+from lib.archive import freeze_archive, prune_schedule, read_archive_records
+from lib.schedule_validation import ScheduleValidationError
+
+DEFAULT_AGE_DAYS = 365
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    cutoff_group = parser.add_mutually_exclusive_group()
+    cutoff_group.add_argument("--older-than-days", type=int, default=DEFAULT_AGE_DAYS)
+    cutoff_group.add_argument(
+        "--before",
+        help="archive talks that started before this date (YYYY-MM-DD, UTC); later dates are clamped to now",
+    )
+    parser.add_argument("--config", default="mkdocs.yml", help="MkDocs config to read markdown extensions from")
+    parser.add_argument("--prune", action="store_true", help="remove archived entries from the schedule file")
+    args = parser.parse_args(argv)
+
+    now = macros.freeze_build_clock()
+    if args.before:
+        cutoff = datetime.fromisoformat(args.before).replace(tzinfo=timezone.utc)
+        if cutoff > now:
+            print(f"--before {args.before} is in the future; only talks before now are archived.", file=sys.stderr)
+            cutoff = now
+    else:
+        cutoff = now - timedelta(days=args.older_than_days)
+
+    config = load_config(args.config)
+    roots = macros.roots_from_config(config)
+    try:
+        talks = macros.get_schedule_data(roots)["talks"]
+    except ScheduleValidationError as exc:
+        print("Schedule validation failed:\n", exc, file=sys.stderr)
+        return 1
+
+    archived = freeze_archive(
+        talks,
+        cutoff,
+        roots.archive_path,
+        config["markdown_extensions"],
+        config["mdx_configs"],
+    )
+    print(f"Archived {len(archived)} talk(s) before {cutoff.date()} into {roots.archive_path}.")
+    for slug in archived:
+        print(f"  - {slug}")
+
+    if args.prune:
+        schedule_path: Path = next((path for path in roots.schedule_paths if path.exists()), roots.schedule_paths[0])
+        data = yaml.safe_load(schedule_path.read_text(encoding="utf-8"))
+        slugs = [record["slug"] for record in read_archive_records(roots.archive_path)]
+        removed = prune_schedule(data, slugs)
+        if removed:
+            schedule_path.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True), encoding="utf-8")
+        print(f"Pruned {removed} archived entr{'y' if removed == 1 else 'ies'} from {schedule_path}.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+"""Time talk front-matter parsing with and without the shared store.
+
+Usage: python bench_front_matter.py [--pages N] [--docs DOCS_DIR] [--repeat R]
+
+Without ``--docs`` a synthetic ``talks/`` tree of N pages is written to a
+temporary directory. The "double" path is what builds used to do: macros parse
+each header, then MkDocs parses it again from the full source. The "shared"
+path parses once through ``FRONT_MATTER`` and hands MkDocs the body alone.
+
+Both paths load YAML with the store's loader (``CSafeLoader`` when available),
+and MkDocs' parse is stood in for by ``split_front_matter``, which splits the
+same way. The timings therefore differ only by the parse that was removed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import yaml
+from mkdocs.utils import meta
+
+from lib.front_matter import FrontMatterStore, _SafeLoader, split_front_matter
+
+_OLD_FRONT_MATTER = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.S)
+
+
+def _write_pages(talks_dir: Path, count: int) -> None:
+    talks_dir.mkdir(parents=True, exist_ok=True)
+    for index in range(count):
+        header = {
+            "title": f"Talk {index}",
+            "date": f"2024-{index % 12 + 1:02d}-{index % 28 + 1:02d}",
+            "time": "17:00",
+            "timezone": "UTC",
+            "speakers": [{"name": f"Speaker {index % 40}", "bio": "Works on data platforms."}],
+            "tags": ["sql", f"tag-{index % 15}"],
+            "abstract": "A walk through query plans, index choices and the numbers behind them. " * 3,
+            "outline": [f"Part {part}" for part in range(6)],
+            "resources": [{"title": "Slides", "url": f"https://example.com/{index}.pdf"}],
+        }
+        body = f"# Talk {index}\n\n" + "Some prose about the session.\n\n" * 20
+        text = f"---\n{yaml.safe_dump(header, sort_keys=False)}---\n\n{body}"
+        (talks_dir / f"talk-{index:05d}.md").write_text(text, encoding="utf-8")
+
+
+def _double_parse(paths: List[Path]) -> int:
+    parses = 0
+    for path in paths:
+        text = path.read_text(encoding="utf-8", errors="ignore")
+        match = _OLD_FRONT_MATTER.match(text)
+        if match:
+            yaml.load(match.group(1), _SafeLoader)
+            parses += 1
+        parses += bool(split_front_matter(path.read_text(encoding="utf-8-sig")).meta)
+    return parses
+
+
+def _shared_parse(paths: List[Path]) -> int:
+    store = FrontMatterStore()
+    for path in paths:
+        store.get(path)
+    for path in paths:
+        entry = store.get(path)
+        meta.get_data("\n" + entry.body if entry and entry.meta else path.read_text(encoding="utf-8-sig"))
+    return store.parses
+
+
+def _best_of(repeat: int, run: Callable[[List[Path]], int], paths: List[Path]) -> tuple:
+    best, parses = float("inf"), 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parses = run(paths)
+        best = min(best, time.perf_counter() - start)
+    return best, parses
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=2000, help="synthetic pages to generate")
+    parser.add_argument("--docs", type=Path, help="benchmark an existing docs directory instead")
+    parser.add_argument("--repeat", type=int, default=3, help="keep the best of this many runs")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docs = args.docs or Path(tmpdir)
+        if args.docs is None:
+            _write_pages(docs / "talks", args.pages)
+        paths = sorted((docs / "talks").glob("*.md"))
+        double_time, double_parses = _best_of(args.repeat, _double_parse, paths)
+        shared_time, shared_parses = _best_of(args.repeat, _shared_parse, paths)
+
+    print(f"{len(paths)} talk pages, YAML loader: {_SafeLoader.__name__}")
+    print(f"double parse: {double_time * 1000:8.1f} ms, {double_parses} YAML parses")
+    print(f"shared store: {shared_time * 1000:8.1f} ms, {shared_parses} YAML parses")
+    if shared_time:
+        print(f"speed-up:     {double_time / shared_time:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""Build several tenant sites in one process (or a small process pool).
+
+Usage: python build_tenants.py tenants.yml [--jobs N]
+
+The tenants file lists one entry per site; paths are relative to the file::
+
+    tenants:
+      - name: platform
+        docs_dir: tenants/platform/docs
+        schedule: tenants/platform/schedule.yml
+        site_dir: site/platform
+        config_file: mkdocs.yml   # optional, defaults to ./mkdocs.yml
+
+Imports and the YAML, validation and snapshot caches in ``lib.parse_cache``
+(plus the front-matter store) are shared by every tenant built in the same
+process, including the copy of ``macros`` that mkdocs-macros re-executes for
+each build, so each worker pays the cold start once instead of once per tenant.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+import yaml
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+
+from lib.schedule_validation import ScheduleValidationError
+
+ROOT = Path(__file__).resolve().parent
+
+
+def load_tenants(path: Path) -> List[Dict[str, str]]:
+    """Read the tenants file and resolve every path against its directory."""
+    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    base = path.resolve().parent
+    tenants: List[Dict[str, str]] = []
+    for entry in data.get("tenants") or []:
+        name = str(entry["name"])
+        tenants.append(
+            {
+                "name": name,
+                "docs_dir": str(base / entry["docs_dir"]),
+                "schedule": str(base / entry["schedule"]),
+                "site_dir": str(base / entry.get("site_dir", f"site/{name}")),
+                "config_file": str(base / entry["config_file"]) if entry.get("config_file") else str(ROOT / "mkdocs.yml"),
+            }
+        )
+    return tenants
+
+
+def build_tenant(tenant: Dict[str, str]) -> float:
+    """Build a single tenant site in the current process and return the elapsed seconds."""
+    started = time.perf_counter()
+    config = load_config(tenant["config_file"], docs_dir=tenant["docs_dir"], site_dir=tenant["site_dir"])
+    config["extra"]["schedule"] = tenant["schedule"]
+    build(config)
+    return time.perf_counter() - started
+
+
+def build_tenants(tenants: List[Dict[str, str]], jobs: int = 1) -> Dict[str, float]:
+    """Build every tenant, sequentially or across ``jobs`` worker processes."""
+    if jobs <= 1:
+        return {tenant["name"]: build_tenant(tenant) for tenant in tenants}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        timings = pool.map(build_tenant, tenants)
+        return {tenant["name"]: elapsed for tenant, elapsed in zip(tenants, timings)}
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("tenants", type=Path, help="YAML file listing the tenant sites")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes (default: 1, in-process)")
+    args = parser.parse_args(argv)
+
+    tenants = load_tenants(args.tenants)
+    if not tenants:
+        print(f"No tenants defined in {args.tenants}.", file=sys.stderr)
+        return 1
+    try:
+        timings = build_tenants(tenants, args.jobs)
+    except ScheduleValidationError as exc:
+        print("Tenant build failed:\n", exc, file=sys.stderr)
+        return 1
+    for name, elapsed in timings.items():
+        print(f"{name}: built in {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,30 +1,65 @@
 from __future__ import annotations
 
+import copy
+import logging
 from pathlib import Path
-from typing import Dict
+from datetime import datetime
+from typing import Any, Dict, List, Set, Tuple
+
+from mkdocs.plugins import CombinedEvent, event_priority
 
 import macros
+from lib.archive import archived_page_source
+from lib.asset_bundle import bundle_site_assets
+from lib.calendar_pages import generate_calendar_pages
+from lib.content_dates import git_commit_dates
+from lib.content_history import ContentHistory, content_hash, history_path
+from lib.front_matter import FRONT_MATTER
 from lib.generated_talks import (
     GENERATED_DIR_NAME,
     generate_missing_talk_pages,
+    prune_generated_root,
     purge_generated_files,
     read_generated_source,
-    reset_generated_root,
 )
+from lib.precompress import precompress_site
+from lib.related_talks import compute_related, render_related_section
+from lib.site_manifest import write_manifest
+from lib.syndication import publish_feeds, publish_sitemap
+from lib.taxonomy import Taxonomy, generate_taxonomy_pages, group_talks, render_talk_terms
 
 GENERATED_TALKS: Dict[str, macros.Talk] = {}
+GENERATED_PAGES: Set[str] = set()
+RELATED_TALKS: Dict[str, List[macros.Talk]] = {}
+PAGE_INDEX: Dict[str, Tuple[str, str]] = {}
+PAGE_META: Dict[str, Dict[str, Any]] = {}
+TAXONOMY = Taxonomy()
+TALKS_BY_LINK: Dict[str, macros.Talk] = {}
+# Talk pages whose body already links speakers and topics (freshly generated, not archived).
+TERMS_LINKED: Set[str] = set()
+CACHE_DIR_NAME = ".cache"
+
+log = logging.getLogger("mkdocs.hooks")
+
+
+def on_config(config):
+    """Freeze the build clock so every macro and hook agrees on what "now" is."""
+    macros.freeze_build_clock()
+    return config
 
 
 def on_files(files, config):
-    """Populate MkDocs files with generated talk pages based on the schedule data."""
-    schedule = macros.get_schedule_data()
+    """Populate MkDocs files with generated talk, calendar and taxonomy pages from the schedule data."""
+    global TAXONOMY
+    schedule = macros.get_schedule_data(macros.roots_from_config(config))
     docs_dir = Path(config["docs_dir"])
     site_dir = Path(config["site_dir"])
     use_directory_urls = config.get("use_directory_urls", True)
 
-    reset_generated_root(docs_dir, GENERATED_DIR_NAME)
     purge_generated_files(files, GENERATED_DIR_NAME)
 
+    timeline = schedule["timeline"]
+    taxonomy = TAXONOMY = group_talks(timeline.talks[::-1] + timeline.undated)
     generated = generate_missing_talk_pages(
         schedule["talks"],
         docs_dir,
@@ -32,16 +67,171 @@ def on_files(files, config):
         files,
         use_directory_urls,
         GENERATED_DIR_NAME,
+        {slug: archived_page_source(rendered) for slug, rendered in schedule["archive_pages"].items()},
+        taxonomy.src_path,
     )
     GENERATED_TALKS.clear()
     GENERATED_TALKS.update(generated)
+    TERMS_LINKED.clear()
+    TERMS_LINKED.update(src for src, talk in generated.items() if talk.slug not in schedule["archive_pages"])
+
+    GENERATED_PAGES.clear()
+    GENERATED_PAGES.update(
+        generate_calendar_pages(
+            schedule["timeline"],
+            docs_dir,
+            site_dir,
+            files,
+            use_directory_urls,
+            GENERATED_DIR_NAME,
+        )
+    )
+
+    taxonomy_pages, rewritten = generate_taxonomy_pages(
+        taxonomy,
+        docs_dir,
+        site_dir,
+        files,
+        use_directory_urls,
+        GENERATED_DIR_NAME,
+    )
+    GENERATED_PAGES.update(taxonomy_pages)
+    log.info("Generated %d taxonomy pages (%d changed)", len(taxonomy_pages), rewritten)
+    prune_generated_root(docs_dir, set(GENERATED_TALKS) | GENERATED_PAGES, GENERATED_DIR_NAME)
+
+    cache_dir = Path(config["config_file_path"]).parent / CACHE_DIR_NAME
+    by_slug = {talk.slug: talk for talk in schedule["talks"] if talk.slug}
+    RELATED_TALKS.clear()
+    PAGE_INDEX.clear()
+    PAGE_META.clear()
+    TALKS_BY_LINK.clear()
+    TALKS_BY_LINK.update({talk.link: talk for talk in schedule["talks"] if talk.link})
+    for slug, pairs in compute_related(schedule["talks"], cache_dir / "related").items():
+        talk = by_slug[slug]
+        if talk.link and pairs:
+            RELATED_TALKS[talk.link] = [by_slug[other] for other, _ in pairs]
     return files
 
 
 def on_page_read_source(page, config):
-    """Serve generated Markdown content when MkDocs attempts to read it."""
+    """Serve generated Markdown, reusing front matter the macros or generators already parsed.
+
+    Pages held in the shared store are handed to MkDocs without their YAML
+    header (the leading blank line keeps MkDocs from looking for one), and the
+    stored metadata is restored in ``_restore_page_meta``.
+    """
     src_path = page.file.src_path
-    if src_path in GENERATED_TALKS:
-        docs_dir = Path(config["docs_dir"])
+    generated = src_path in GENERATED_TALKS or src_path in GENERATED_PAGES
+    docs_dir = Path(config["docs_dir"])
+    path = docs_dir / GENERATED_DIR_NAME / src_path if generated else Path(page.file.abs_src_path)
+    if path in FRONT_MATTER:
+        entry = FRONT_MATTER.get(path)
+        if entry and entry.meta:
+            PAGE_META[src_path] = entry.meta
+            return "\n" + entry.body
+    if generated:
         return read_generated_source(docs_dir, src_path, GENERATED_DIR_NAME)
     return None
+
+
+@event_priority(50)
+def _restore_page_meta(markdown, page, config, files):
+    """Put shared front matter back on the page before the macros plugin reads ``page.meta``."""
+    if page.file.src_path in PAGE_META:
+        page.meta = copy.deepcopy(PAGE_META.pop(page.file.src_path))
+    return markdown
+
+
+def _append_related_talks(markdown, page, config, files):
+    """Append taxonomy links and "Related talks", then record the page's content hash.
+
+    Freshly generated talk pages already link their speakers and topics;
+    hand-written and archived ones get a "Filed under" line instead.
+    """
+    src_path = page.file.src_path
+    talk = TALKS_BY_LINK.get(src_path)
+    if talk and src_path not in TERMS_LINKED and "**Filed under:**" not in markdown:
+        terms = render_talk_terms(TAXONOMY, talk, src_path)
+        if terms:
+            markdown = markdown.rstrip() + "\n\n" + terms
+    related = RELATED_TALKS.get(page.file.src_path)
+    if related and "## Related talks" not in markdown:
+        markdown = markdown.rstrip() + "\n\n" + render_related_section(related, page.file.src_path)
+    PAGE_INDEX[page.file.src_path] = (page.canonical_url or page.abs_url or page.url, content_hash(markdown))
+    return markdown
+
+
+on_page_markdown = CombinedEvent(_restore_page_meta, _append_related_talks)
+
+
+def _content_dates(config) -> Tuple[Dict[str, datetime], datetime]:
+    """Return when each built page's sources last changed, plus the schedule data's date.
+
+    Dates come from git, so they do not depend on when the build ran.
+    Generated pages, talk pages (their taxonomy and related-talk links) and
+    pages using macros also follow the schedule data; files
+    with uncommitted changes fall back to the build clock.
+    """
+    roots = macros.roots_from_config(config)
+    now = macros.build_clock()
+    data_paths = [path for path in roots.schedule_paths + (roots.archive_path,) if path.exists()]
+    commits = git_commit_dates(roots.root, [roots.docs, *data_paths])
+    data_date = max((commits.get(path.resolve(), now) for path in data_paths), default=now)
+
+    dates: Dict[str, datetime] = {}
+    for src_path in PAGE_INDEX:
+        if src_path in GENERATED_TALKS or src_path in GENERATED_PAGES:
+            dates[src_path] = data_date
+            continue
+        source = (roots.docs / src_path).resolve()
+        dates[src_path] = commits.get(source, now)
+        text = source.read_text(encoding="utf-8-sig") if source.exists() else ""
+        if src_path in TALKS_BY_LINK or "{{" in text or "{%" in text:
+            dates[src_path] = max(dates[src_path], data_date)
+    return dates, data_date
+
+
+def on_post_build(config):
+    """Write feeds and sitemap, bundle the extra CSS/JS, precompress, then record the site manifest."""
+    site_dir = Path(config["site_dir"])
+    cache_dir = Path(config["config_file_path"]).parent / CACHE_DIR_NAME
+    schedule = macros.get_schedule_data(macros.roots_from_config(config))
+    talk_dates = {talk.link: talk.dt for talk in schedule["talks"] if talk.link}
+    page_dates, data_date = _content_dates(config)
+
+    history = ContentHistory(history_path(cache_dir, cache_dir.parent, site_dir))
+    for src_path, (_url, digest) in PAGE_INDEX.items():
+        history.touch(f"page:{src_path}", digest, page_dates[src_path], talk_dates.get(src_path))
+    publish_sitemap(site_dir, PAGE_INDEX, history, data_date)
+    feeds = publish_feeds(
+        site_dir,
+        config.get("site_url") or "",
+        config["site_name"],
+        schedule["talks"],
+        PAGE_INDEX,
+        history,
+        data_date,
+    )
+    history.save()
+    log.info("Wrote sitemap (%d pages) and %d feeds", len(PAGE_INDEX), len(feeds))
+
+    bundle_site_assets(
+        site_dir,
+        config.get("extra_css", []),
+        config.get("extra_javascript", []),
+        config.get("site_url") or "",
+    )
+
+    report = precompress_site(site_dir, cache_dir / "precompress")
+    if "br" not in report.encodings:
+        log.warning("brotli is not installed; only .gz siblings were written (pip install -r requirements.txt)")
+    log.info(
+        "Precompressed %d files (%d reused): %d of %d bytes saved",
+        report.files,
+        report.reused,
+        report.saved_bytes,
+        report.original_bytes,
+    )
+
+    manifest = write_manifest(site_dir)
+    log.info("Wrote site manifest for %d files", len(manifest))
@@ -0,0 +1,106 @@
+"""Freeze old talks into an immutable snapshot holding parsed data and rendered pages."""
+
+from __future__ import annotations
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import macros
+from lib.generated_talks import build_talk_markdown
+
+ARCHIVE_VERSION = 1
+ARCHIVE_FIELDS = ("slug",) + macros._OVERLAY_FIELDS
+
+_FRONT_MATTER = re.compile(r"^---\s*\n(.*?)\n---\s*\n", re.S)
+
+
+def render_html(markdown_text: str, extensions: Sequence[Any] = (), extension_configs: Optional[Dict] = None) -> str:
+    """Render the body of a talk page (front matter stripped) to HTML."""
+    import markdown
+
+    body = _FRONT_MATTER.sub("", markdown_text, count=1)
+    return markdown.markdown(body, extensions=list(extensions), extension_configs=extension_configs or {})
+
+
+def archive_record(
+    talk: macros.Talk,
+    extensions: Sequence[Any] = (),
+    extension_configs: Optional[Dict] = None,
+) -> Dict[str, Any]:
+    """Serialise a talk with its generated Markdown and pre-rendered HTML."""
+    record: Dict[str, Any] = {}
+    for name in ARCHIVE_FIELDS:
+        value = getattr(talk, name)
+        if value not in (None, [], {}, ""):
+            record[name] = value
+    record["markdown"] = build_talk_markdown(talk)
+    record["html"] = render_html(record["markdown"], extensions, extension_configs)
+    return record
+
+
+def read_archive_records(path: Path) -> List[Dict[str, Any]]:
+    if not path.exists():
+        return []
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    return list(payload.get("talks") or [])
+
+
+def freeze_archive(
+    talks: Iterable[macros.Talk],
+    cutoff: datetime,
+    path: Path,
+    extensions: Sequence[Any] = (),
+    extension_configs: Optional[Dict] = None,
+) -> List[str]:
+    """Append talks that started before ``cutoff`` to the snapshot at ``path``.
+
+    Only past talks are frozen: a ``cutoff`` after the build clock is clamped
+    to it, so upcoming talks stay editable in the schedule. Records already in
+    the snapshot are never rewritten. Returns the newly archived slugs, oldest
+    first.
+    """
+    cutoff = min(cutoff, macros.build_clock())
+    records = read_archive_records(path)
+    archived = {record["slug"] for record in records}
+    fresh = sorted(
+        (talk for talk in talks if talk.slug and talk.dt and talk.dt < cutoff and talk.slug not in archived),
+        key=lambda talk: talk.dt,
+    )
+    if not fresh:
+        return []
+    records.extend(archive_record(talk, extensions, extension_configs) for talk in fresh)
+    payload = {"version": ARCHIVE_VERSION, "talks": records}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=1, ensure_ascii=False, sort_keys=True) + "\n", encoding="utf-8")
+    return [talk.slug for talk in fresh]
+
+
+def archived_page_source(rendered: Dict[str, str]) -> str:
+    """Return the page source for an archived talk: its front matter plus the frozen HTML.
+
+    Python-Markdown passes a raw HTML block straight through, so archived pages
+    skip Markdown parsing on every build.
+    """
+    markdown_text = rendered.get("markdown", "")
+    html = rendered.get("html", "")
+    match = _FRONT_MATTER.match(markdown_text)
+    if not html or not match:
+        return markdown_text
+    return f"---\n{match.group(1)}\n---\n\n<div class=\"archived-talk\">\n{html}\n</div>\n"
+
+
+def prune_schedule(data: Any, slugs: Iterable[str]) -> int:
+    """Drop archived entries from a parsed schedule in place and return how many were removed."""
+    drop = set(slugs)
+    removed = 0
+    sections = data.values() if isinstance(data, dict) else [data]
+    for section in sections:
+        if not isinstance(section, list):
+            continue
+        kept = [item for item in section if not (isinstance(item, dict) and item.get("slug") in drop)]
+        removed += len(section) - len(kept)
+        section[:] = kept
+    return removed
@@ -0,0 +1,132 @@
+"""Minify, bundle and content-hash the site's extra CSS/JS after a MkDocs build."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List
+from urllib.parse import urlsplit
+
+MANIFEST_NAME = "assets/manifest.json"
+HASH_LENGTH = 8
+
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE = re.compile(r"\s+")
+_CSS_PUNCT = re.compile(r"\s*([{};,>])\s*")
+_CSS_COLON = re.compile(r":\s+")
+
+
+def minify_css(text: str) -> str:
+    """Strip comments and redundant whitespace from a stylesheet."""
+    text = _CSS_COMMENT.sub("", text.lstrip("\ufeff"))
+    text = _CSS_SPACE.sub(" ", text)
+    text = _CSS_PUNCT.sub(r"\1", text)
+    text = _CSS_COLON.sub(":", text)
+    return text.replace(";}", "}").strip()
+
+
+def minify_js(text: str) -> str:
+    """Drop indentation, blank lines and whole-line comments from a script.
+
+    This is deliberately conservative: statements are never joined, and lines
+    inside a multi-line template literal are kept verbatim.
+    """
+    kept: List[str] = []
+    in_template = False
+    for line in text.lstrip("\ufeff").splitlines():
+        if in_template:
+            kept.append(line)
+        else:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("//"):
+                continue
+            kept.append(stripped)
+        if line.count("`") % 2:
+            in_template = not in_template
+    return "\n".join(kept) + "\n"
+
+
+def _asset_paths(entries: Iterable[object], site_dir: Path) -> List[str]:
+    paths: List[str] = []
+    for entry in entries:
+        path = str(getattr(entry, "path", entry))
+        if "://" in path or path.startswith("//"):
+            continue
+        if (site_dir / path).is_file():
+            paths.append(path)
+    return paths
+
+
+def _write_bundle(site_dir: Path, sources: List[str], suffix: str, minify) -> str:
+    parts = [minify((site_dir / source).read_text(encoding="utf-8")) for source in sources]
+    separator = "\n" if suffix == ".css" else ";\n"
+    content = separator.join(parts)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+    stem = Path(sources[0]).stem if len(sources) == 1 else "bundle"
+    target = f"{Path(sources[0]).parent.as_posix()}/{stem}.{digest}{suffix}"
+    (site_dir / target).write_text(content, encoding="utf-8")
+    return target
+
+
+def _url_prefixes(site_url: str) -> str:
+    """Regex for the part of an asset URL before its site-relative path.
+
+    Pages normally use ``../`` chains, but MkDocs renders ``404.html`` with
+    absolute URLs under the ``site_url`` path (``/tech-talks-site/assets/...``).
+    """
+    base_path = urlsplit(site_url).path.rstrip("/") + "/"
+    prefixes = [re.escape(base_path)]
+    if "://" in site_url:
+        prefixes.insert(0, re.escape(site_url.rstrip("/") + "/"))
+    return r"((?:\.\./)*|" + "|".join(prefixes) + ")"
+
+
+def _rewrite_html(html: str, css: List[str], js: List[str], manifest: Dict[str, str], site_url: str = "") -> str:
+    prefix = _url_prefixes(site_url)
+    for source in css:
+        pattern = re.compile(r'(<link[^>]*href=")' + prefix + re.escape(source) + '"')
+        html = pattern.sub(lambda m: f'{m.group(1)}{m.group(2)}{manifest[source]}"', html)
+    for index, source in enumerate(js):
+        pattern = re.compile(r'<script src="' + prefix + re.escape(source) + r'"[^>]*></script>\n?')
+        if index == 0:
+            html = pattern.sub(lambda m: f'<script src="{m.group(1)}{manifest[source]}"></script>\n', html)
+        else:
+            html = pattern.sub("", html)
+    return html
+
+
+def bundle_site_assets(
+    site_dir: Path,
+    extra_css: Iterable[object],
+    extra_javascript: Iterable[object],
+    site_url: str = "",
+) -> Dict[str, str]:
+    """Bundle local extra assets, rewrite HTML references and write the manifest.
+
+    The original files are left in place so pages cached before the deploy keep
+    working; every freshly built page points at the hashed bundles instead.
+    """
+    css = _asset_paths(extra_css, site_dir)
+    js = _asset_paths(extra_javascript, site_dir)
+    manifest: Dict[str, str] = {}
+    if css:
+        target = _write_bundle(site_dir, css, ".css", minify_css)
+        manifest.update({source: target for source in css})
+    if js:
+        target = _write_bundle(site_dir, js, ".js", minify_js)
+        manifest.update({source: target for source in js})
+    if not manifest:
+        return manifest
+
+    for html_path in site_dir.rglob("*.html"):
+        original = html_path.read_text(encoding="utf-8")
+        rewritten = _rewrite_html(original, css, js, manifest, site_url)
+        if rewritten != original:
+            html_path.write_text(rewritten, encoding="utf-8")
+
+    manifest_path = site_dir / MANIFEST_NAME
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return manifest
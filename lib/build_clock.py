@@ -0,0 +1,30 @@
+"""The single "now" of a build, shared by macros, hooks and every ``lib`` module.
+
+It lives outside ``macros.py`` because mkdocs-macros executes its own copy of
+that module, which would otherwise carry a second, later clock.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+_BUILD_CLOCK: Dict[str, datetime] = {}
+
+
+def freeze_build_clock(now: Optional[datetime] = None) -> datetime:
+    """Pin the instant used to split upcoming and past talks for the current build.
+
+    Honours ``SOURCE_DATE_EPOCH`` so reproducible builds see the same "now".
+    """
+    if now is None:
+        epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        now = datetime.fromtimestamp(int(epoch), timezone.utc) if epoch else datetime.now(timezone.utc)
+    _BUILD_CLOCK["now"] = now
+    return now
+
+
+def build_clock() -> datetime:
+    """Return the frozen build instant, freezing it on first use."""
+    return _BUILD_CLOCK.get("now") or freeze_build_clock()
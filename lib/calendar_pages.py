@@ -0,0 +1,82 @@
+"""Generate monthly calendar pages from the timeline index during the MkDocs build."""
+
+from __future__ import annotations
+
+import calendar
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import macros
+from lib.generated_talks import GENERATED_DIR_NAME, register_generated_file, write_if_changed
+from lib.timeline import TimelineIndex
+
+CALENDAR_DIR_NAME = "calendar"
+
+
+def month_src_path(year: int, month: int) -> str:
+    return f"{CALENDAR_DIR_NAME}/{year:04d}-{month:02d}.md"
+
+
+def build_month_markdown(year: int, month: int, timeline: TimelineIndex, months: List[Tuple[int, int]]) -> str:
+    """Return the Markdown for one month, rendered from that month's index slice."""
+    src_path = month_src_path(year, month)
+    lines = [f"# {calendar.month_name[month]} {year}", ""]
+    lines.append(macros.render_talk_list(timeline.in_month(year, month), src_path))
+    lines.append("")
+
+    position = months.index((year, month))
+    links: List[str] = []
+    if position > 0:
+        prev_year, prev_month = months[position - 1]
+        links.append(f"[← {calendar.month_name[prev_month]} {prev_year}]({prev_year:04d}-{prev_month:02d}.md)")
+    links.append("[All months](index.md)")
+    if position + 1 < len(months):
+        next_year, next_month = months[position + 1]
+        links.append(f"[{calendar.month_name[next_month]} {next_year} →]({next_year:04d}-{next_month:02d}.md)")
+    lines.append(" | ".join(links))
+    return "\n".join(lines).strip() + "\n"
+
+
+def build_calendar_index(months: List[Tuple[int, int]], timeline: TimelineIndex) -> str:
+    """Return the Markdown for the calendar landing page, newest year first."""
+    lines = ["# Calendar", ""]
+    if not months:
+        lines.append("No dated talks yet.")
+        return "\n".join(lines) + "\n"
+    by_year: Dict[int, List[int]] = {}
+    for year, month in months:
+        by_year.setdefault(year, []).append(month)
+    for year in sorted(by_year, reverse=True):
+        lines.extend([f"## {year}", ""])
+        for month in by_year[year]:
+            count = len(timeline.in_month(year, month))
+            label = "talk" if count == 1 else "talks"
+            lines.append(f"- [{calendar.month_name[month]}]({year:04d}-{month:02d}.md) ({count} {label})")
+        lines.append("")
+    return "\n".join(lines).strip() + "\n"
+
+
+def generate_calendar_pages(
+    timeline: TimelineIndex,
+    docs_dir: Path,
+    site_dir: Path,
+    files,
+    use_directory_urls: bool,
+    dir_name: str = GENERATED_DIR_NAME,
+) -> List[str]:
+    """Generate an index plus one page per month that has talks; return their source paths."""
+    generated_root = docs_dir / dir_name
+    months = timeline.months()
+    pages = {f"{CALENDAR_DIR_NAME}/index.md": build_calendar_index(months, timeline)}
+    for year, month in months:
+        pages[month_src_path(year, month)] = build_month_markdown(year, month, timeline, months)
+
+    generated: List[str] = []
+    for src_path, content in pages.items():
+        if (docs_dir / src_path).exists():
+            continue
+        generated_path = generated_root / src_path
+        write_if_changed(generated_path, content)
+        register_generated_file(files, src_path, docs_dir, site_dir, use_directory_urls, generated_path)
+        generated.append(src_path)
+    return generated
@@ -0,0 +1,52 @@
+"""Last-commit dates of source files, used to date feed and sitemap entries.
+
+Dates taken from git depend only on the content that was committed, so two
+builds of the same tree agree even when their build clocks differ.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+
+def _git(root: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(root), *args],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def git_commit_dates(root: Path, paths: Iterable[Path]) -> Dict[Path, datetime]:
+    """Return the last commit time of every committed, unmodified file under ``paths``.
+
+    Keys are resolved absolute paths. Files with uncommitted changes are left
+    out, and so is everything when ``root`` is not in a git checkout; callers
+    fall back to the build clock for those. History is read in a single
+    ``git log`` pass, so a shallow clone dates every file to its newest commit.
+    """
+    pathspecs: List[str] = [str(path.resolve()) for path in paths]
+    if not pathspecs:
+        return {}
+    try:
+        top = Path(_git(root, "rev-parse", "--show-toplevel").strip())
+        log = _git(root, "log", "--format=%x00%ct", "--name-only", "--no-renames", "--", *pathspecs)
+        dirty = _git(root, "status", "--porcelain=v1", "-z", "--untracked-files=no", "--", *pathspecs)
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    skip = {top / entry[3:] for entry in dirty.split("\0") if len(entry) > 3}
+    dates: Dict[Path, datetime] = {}
+    stamp = None
+    for line in log.splitlines():
+        if line.startswith("\0"):
+            stamp = datetime.fromtimestamp(int(line[1:]), timezone.utc)
+        elif line and stamp is not None:
+            path = top / line
+            if path not in dates and path not in skip:
+                dates[path] = stamp
+    return dates
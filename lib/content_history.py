@@ -0,0 +1,78 @@
+"""Persisted content-hash history used to derive stable ``lastmod``/``published`` dates."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+
+HISTORY_DIR_NAME = "history"
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def history_path(cache_dir: Path, root: Path, site_dir: Path) -> Path:
+    """Return the history file for the site built into ``site_dir``.
+
+    Each site (tenant) gets its own file, named after ``site_dir`` relative to
+    the project root so the name is the same on every machine.
+    """
+    site_dir = site_dir.resolve()
+    try:
+        key = site_dir.relative_to(root.resolve()).as_posix()
+    except ValueError:
+        key = site_dir.as_posix()
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", key).strip("-") or "site"
+    return cache_dir / HISTORY_DIR_NAME / f"{slug}.json"
+
+
+class ContentHistory:
+    """Map of key -> ``{"hash", "first_seen", "lastmod"}`` stored as JSON.
+
+    ``lastmod`` only moves when the recorded hash changes, so rebuilding
+    unchanged content reports the same dates as the previous build. The dates
+    passed in come from the content (see ``lib.content_dates``), never from the
+    build clock, so a rebuild at a later time writes identical files.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, str]] = {}
+        if path.exists():
+            try:
+                self.entries = json.loads(path.read_text(encoding="utf-8"))
+            except ValueError:
+                self.entries = {}
+
+    def touch(self, key: str, digest: str, when: datetime, first_seen: Optional[datetime] = None) -> Dict[str, str]:
+        """Record ``digest`` for ``key``, last changed at ``when``, and return its (possibly updated) entry.
+
+        ``lastmod`` never moves backwards, even if ``when`` is older than the
+        date already recorded.
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            seen = min(first_seen, when).isoformat() if first_seen else when.isoformat()
+            entry = {"hash": digest, "first_seen": seen, "lastmod": seen}
+            self.entries[key] = entry
+        elif entry["hash"] != digest:
+            entry["hash"] = digest
+            entry["lastmod"] = max(datetime.fromisoformat(entry["lastmod"]), when).isoformat()
+        return entry
+
+    def get(self, key: str) -> Optional[Dict[str, str]]:
+        return self.entries.get(key)
+
+    def save(self) -> None:
+        """Write the history atomically so a concurrent reader never sees a torn file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.tmp{os.getpid()}")
+        tmp.write_text(json.dumps(self.entries, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+        tmp.replace(self.path)
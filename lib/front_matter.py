@@ -0,0 +1,73 @@
+"""Process-wide store of parsed Markdown front matter, shared by macros, hooks and MkDocs."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+# Same delimiters MkDocs accepts in ``mkdocs.utils.meta``.
+_YAML_RE = re.compile(r"^-{3}[ \t]*\n(.*?\n)(?:\.{3}|-{3})[ \t]*\n", re.M | re.S)
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass
+class FrontMatter:
+    """Parsed metadata plus the Markdown body that follows it."""
+
+    meta: Dict[str, Any] = field(default_factory=dict)
+    body: str = ""
+
+
+def split_front_matter(text: str) -> FrontMatter:
+    """Split ``text`` the way MkDocs does: invalid or non-mapping YAML leaves the text intact."""
+    match = _YAML_RE.match(text)
+    if not match:
+        return FrontMatter({}, text)
+    try:
+        data = yaml.load(match.group(1), _SafeLoader)
+    except Exception:
+        return FrontMatter({}, text)
+    if not isinstance(data, dict):
+        return FrontMatter({}, text)
+    return FrontMatter(data, text[match.end() :].lstrip("\n"))
+
+
+class FrontMatterStore:
+    """Parse each file's front matter once per (mtime, size) and hand out the shared result."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[Tuple[int, int], FrontMatter]] = {}
+        self.parses = 0
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def get(self, path: Path) -> Optional[FrontMatter]:
+        """Return the parsed front matter for ``path``, or ``None`` if the file is missing."""
+        if not path.exists():
+            return None
+        stamp = self._stamp(path)
+        entry = self._entries.get(str(path))
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        # utf-8-sig matches MkDocs, which drops a leading byte-order mark.
+        parsed = split_front_matter(path.read_text(encoding="utf-8-sig"))
+        self.parses += 1
+        self._entries[str(path)] = (stamp, parsed)
+        return parsed
+
+    def put(self, path: Path, meta: Dict[str, Any], body: str) -> None:
+        """Record front matter that is already known, e.g. for a page this build just generated."""
+        self._entries[str(path)] = (self._stamp(path), FrontMatter(meta, body))
+
+    def __contains__(self, path: object) -> bool:
+        return str(path) in self._entries
+
+
+FRONT_MATTER = FrontMatterStore()
@@ -2,25 +2,46 @@
 
 from __future__ import annotations
 
-import shutil
+import hashlib
 import warnings
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 import yaml
 from mkdocs.structure.files import File
 
 import macros
+from lib.front_matter import FRONT_MATTER
 
 GENERATED_DIR_NAME = "_generated"
 
+# ``(kind, label) -> src_path`` of the taxonomy page for a speaker, tag or topic.
+TermPath = Callable[[str, str], Optional[str]]
 
-def reset_generated_root(docs_dir: Path, dir_name: str = GENERATED_DIR_NAME) -> Path:
-    """Clear the generated directory and return its path without recreating it yet."""
-    target = docs_dir / dir_name
-    if target.exists():
-        shutil.rmtree(target)
-    return target
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write ``content`` unless the file already holds the same bytes (compared by hash)."""
+    encoded = content.encode("utf-8")
+    if path.exists() and hashlib.sha256(path.read_bytes()).digest() == hashlib.sha256(encoded).digest():
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(encoded)
+    return True
+
+
+def prune_generated_root(docs_dir: Path, keep: Set[str], dir_name: str = GENERATED_DIR_NAME) -> int:
+    """Delete generated files that were not produced by this build and return how many were removed."""
+    generated_root = docs_dir / dir_name
+    if not generated_root.exists():
+        return 0
+    removed = 0
+    for path in sorted(generated_root.rglob("*"), reverse=True):
+        if path.is_file() and path.relative_to(generated_root).as_posix() not in keep:
+            path.unlink()
+            removed += 1
+        elif path.is_dir() and not any(path.iterdir()):
+            path.rmdir()
+    return removed
 
 
 def purge_generated_files(files, dir_name: str = GENERATED_DIR_NAME) -> None:
@@ -68,8 +89,19 @@ def _render_outline(talk: macros.Talk) -> str:
     return "\n".join(f"- {item}" for item in outline)
 
 
-def build_talk_markdown(talk: macros.Talk) -> str:
-    """Return the Markdown body for a generated talk detail page."""
+def _term_links(kind: str, labels: List[str], term_path: Optional[TermPath], page_src: str) -> str:
+    rendered = []
+    for label in labels:
+        target = term_path(kind, label) if term_path else None
+        rendered.append(f"[{label}]({macros._relative_link(target, page_src)})" if target else label)
+    return ", ".join(rendered)
+
+
+def build_talk_page(talk: macros.Talk, term_path: Optional[TermPath] = None) -> Tuple[Dict[str, Any], str]:
+    """Return the front matter and the Markdown body for a generated talk detail page.
+
+    With ``term_path``, speaker, topic and tag names link to their taxonomy pages.
+    """
     front_matter = _clean_front_matter(
         {
             "title": talk.title,
@@ -84,17 +116,21 @@ def build_talk_markdown(talk: macros.Talk) -> str:
             "recording_url": talk.recording_url,
         }
     )
-    header = yaml.safe_dump(front_matter, sort_keys=False, allow_unicode=True).strip()
 
-    lines = ["---", header, "---", "", f"# {talk.title}", ""]
+    lines = [f"# {talk.title}", ""]
     lines.append(f"**Date:** {macros._format_date(talk)}")
     tz_display = talk.timezone or "UTC"
     if talk.time or talk.timezone:
         lines.append(f"**Time:** {macros._format_time(talk)} ({tz_display})")
-    lines.append(f"**Speakers:** {', '.join(talk.speakers) if talk.speakers else 'TBA'}")
+    page_src = f"talks/{talk.slug}.md"
+    speakers = _term_links("speakers", talk.speakers, term_path, page_src)
+    lines.append(f"**Speakers:** {speakers or 'TBA'}")
     topics = talk.topics or talk.tags
     if topics:
-        lines.append(f"**Topics:** {', '.join(topics)}")
+        kind = "topics" if talk.topics else "tags"
+        lines.append(f"**Topics:** {_term_links(kind, topics, term_path, page_src)}")
+    if talk.topics and talk.tags:
+        lines.append(f"**Tags:** {_term_links('tags', talk.tags, term_path, page_src)}")
     lines.append("")
 
     lines.extend(["## Abstract", talk.abstract or "Details coming soon.", ""])
@@ -111,15 +147,37 @@ def build_talk_markdown(talk: macros.Talk) -> str:
     if talk.speaker_details and speaker_bios and speaker_bios != ", ".join(talk.speakers):
         lines.extend(["## Speaker Bios", speaker_bios, ""])
 
-    return "\n".join(lines).strip() + "\n"
+    return front_matter, "\n".join(lines).strip() + "\n"
 
 
-def write_generated_markdown(talk: macros.Talk, generated_root: Path) -> Path:
-    """Persist the generated Markdown for a talk and return the absolute path."""
-    content = build_talk_markdown(talk)
+def build_talk_markdown(talk: macros.Talk) -> str:
+    """Return the full Markdown source, front matter included, for a generated talk page."""
+    return _compose_markdown(*build_talk_page(talk))
+
+
+def _compose_markdown(front_matter: Dict[str, Any], body: str) -> str:
+    header = yaml.safe_dump(front_matter, sort_keys=False, allow_unicode=True).strip()
+    return f"---\n{header}\n---\n\n{body}"
+
+
+def write_generated_markdown(
+    talk: macros.Talk,
+    generated_root: Path,
+    content: Optional[str] = None,
+    term_path: Optional[TermPath] = None,
+) -> Path:
+    """Persist the generated Markdown for a talk and return the absolute path.
+
+    Freshly built pages are recorded in the shared front-matter store so MkDocs
+    never has to re-parse YAML that was just dumped from the talk itself.
+    """
     generated_path = generated_root / "talks" / f"{talk.slug}.md"
-    generated_path.parent.mkdir(parents=True, exist_ok=True)
-    generated_path.write_text(content, encoding="utf-8")
+    if content is not None:
+        write_if_changed(generated_path, content)
+        return generated_path
+    front_matter, body = build_talk_page(talk, term_path)
+    write_if_changed(generated_path, _compose_markdown(front_matter, body))
+    FRONT_MATTER.put(generated_path, front_matter, body)
     return generated_path
 
 
@@ -149,8 +207,15 @@ def generate_missing_talk_pages(
     files,
     use_directory_urls: bool,
     dir_name: str = GENERATED_DIR_NAME,
+    prebuilt: Optional[Dict[str, str]] = None,
+    term_path: Optional[TermPath] = None,
 ) -> Dict[str, macros.Talk]:
-    """Generate Markdown files for talks without manually authored pages."""
+    """Generate Markdown files for talks without manually authored pages.
+
+    ``prebuilt`` maps slugs to page sources frozen in the archive snapshot;
+    those are written as-is instead of being rendered again.
+    """
+    prebuilt = prebuilt or {}
     generated: Dict[str, macros.Talk] = {}
     generated_root = docs_dir / dir_name
     for talk in talks:
@@ -160,16 +225,15 @@ def generate_missing_talk_pages(
         manual_path = docs_dir / Path(src_path)
         if manual_path.exists():
             continue
-        generated_path = write_generated_markdown(talk, generated_root)
+        generated_path = write_generated_markdown(talk, generated_root, prebuilt.get(talk.slug), term_path)
         register_generated_file(files, src_path, docs_dir, site_dir, use_directory_urls, generated_path)
         generated[src_path] = talk
     return generated
 
 
 def read_generated_source(docs_dir: Path, src_path: str, dir_name: str = GENERATED_DIR_NAME) -> str | None:
-    """Fetch the on-disk Markdown for a generated talk page if it exists."""
-    generated_root = docs_dir / dir_name
-    generated_path = generated_root / "talks" / Path(src_path).name
+    """Fetch the on-disk Markdown for a generated page if it exists."""
+    generated_path = docs_dir / dir_name / Path(src_path)
     if not generated_path.exists():
         return None
     return generated_path.read_text(encoding="utf-8")
@@ -0,0 +1,48 @@
+"""Process-wide caches for parsed sources and built snapshots.
+
+mkdocs-macros executes ``macros.py`` afresh (``module_from_spec``) on every
+``on_config``, so globals in that module neither survive a rebuild nor reach
+the separate ``import macros`` used by ``hooks.py`` and ``lib``. Caches that
+must be shared by all of them live here instead.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+
+class ParseCache:
+    """Memoise ``parse(path)`` per ``(kind, path)`` by file mtime and size."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+        self.parses: Counter = Counter()
+
+    def get(self, kind: str, path: Path, parse: Callable[[Path], Any]) -> Any:
+        stat = path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get((kind, str(path)))
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        value = parse(path)
+        self.parses[kind] += 1
+        self._entries[(kind, str(path))] = (stamp, value)
+        return value
+
+    def peek(self, kind: str, path: Path) -> Any:
+        """Return the cached value for ``(kind, path)`` without parsing, or ``None``."""
+        entry = self._entries.get((kind, str(path)))
+        return entry[1] if entry else None
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or len(key) != 2:
+            return False
+        return (key[0], str(key[1])) in self._entries
+
+
+PARSE_CACHE = ParseCache()
+
+# Built schedule snapshots, keyed by site roots as a tuple of paths.
+SNAPSHOTS: Dict[Tuple[Path, ...], Dict[str, Any]] = {}
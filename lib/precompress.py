@@ -0,0 +1,129 @@
+"""Precompress built site files into ``.gz``/``.br`` siblings for static serving."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+COMPRESSIBLE_SUFFIXES = (".html", ".json", ".css", ".js", ".svg", ".xml", ".txt")
+MIN_SIZE = 256
+# Cached payloads unused for this long are deleted at the end of a run.
+CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+@dataclass
+class PrecompressReport:
+    """Summary of one precompression run."""
+
+    files: int = 0
+    compressed: int = 0
+    reused: int = 0
+    original_bytes: int = 0
+    saved_bytes: int = 0
+    pruned: int = 0
+    encodings: List[str] = field(default_factory=list)
+
+
+def _encodings() -> List[str]:
+    return ["gz", "br"] if brotli is not None else ["gz"]
+
+
+def _compress(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _compress_into_cache(source: str, digest: str, cache_dir: str, encodings: List[str]) -> None:
+    data = Path(source).read_bytes()
+    for encoding in encodings:
+        target = Path(cache_dir) / f"{digest}.{encoding}"
+        tmp = target.with_suffix(f".{encoding}.tmp{os.getpid()}")
+        tmp.write_bytes(_compress(data, encoding))
+        tmp.replace(target)
+
+
+def prune_cache(cache_dir: Path, max_age: float = CACHE_MAX_AGE, now: Optional[float] = None) -> int:
+    """Delete cached payloads (and stray temp files) not touched within ``max_age`` seconds.
+
+    Reused entries have their mtime bumped on every run, so this keeps whatever
+    any recent build needed, even when several sites share the cache.
+    """
+    cutoff = (time.time() if now is None else now) - max_age
+    removed = 0
+    for path in cache_dir.iterdir():
+        if path.is_file() and path.stat().st_mtime < cutoff:
+            path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
+def _candidates(site_dir: Path) -> List[Path]:
+    return sorted(
+        path
+        for path in site_dir.rglob("*")
+        if path.is_file() and path.suffix in COMPRESSIBLE_SUFFIXES and path.stat().st_size >= MIN_SIZE
+    )
+
+
+def precompress_site(site_dir: Path, cache_dir: Path, workers: Optional[int] = None) -> PrecompressReport:
+    """Write maximum-level compressed siblings for every compressible file.
+
+    Compressed payloads are cached under ``cache_dir`` by content hash, so files
+    that did not change since the previous build are copied instead of recompressed.
+    Siblings that would not be smaller than the original are not written, and
+    cache entries no build has used for ``CACHE_MAX_AGE`` are pruned.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    encodings = _encodings()
+    report = PrecompressReport(encodings=encodings)
+    digests: Dict[Path, str] = {}
+    pending: List[Tuple[str, str]] = []
+    for path in _candidates(site_dir):
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        digests[path] = digest
+        cached = [cache_dir / f"{digest}.{encoding}" for encoding in encodings]
+        if all(entry.exists() for entry in cached):
+            for entry in cached:
+                os.utime(entry)
+            report.reused += 1
+        else:
+            pending.append((str(path), digest))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_compress_into_cache, source, digest, str(cache_dir), encodings)
+                for source, digest in pending
+            ]
+            for future in futures:
+                future.result()
+        report.compressed = len(pending)
+
+    for path, digest in digests.items():
+        size = path.stat().st_size
+        report.files += 1
+        report.original_bytes += size
+        best = size
+        for encoding in encodings:
+            cached = cache_dir / f"{digest}.{encoding}"
+            compressed_size = cached.stat().st_size
+            if compressed_size >= size:
+                continue
+            shutil.copyfile(cached, path.with_name(f"{path.name}.{encoding}"))
+            best = min(best, compressed_size)
+        report.saved_bytes += size - best
+    report.pruned = prune_cache(cache_dir)
+    return report
@@ -0,0 +1,174 @@
+"""Precompute "related talks" from sparse tag/topic/speaker and TF-IDF text vectors."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+import macros
+from lib.precompress import prune_cache
+
+DEFAULT_TOP_K = 3
+# Text terms that appear in more than this share of talks carry almost no
+# signal but dominate the posting lists, so they are dropped before scoring.
+MAX_TERM_SHARE = 0.5
+FIELD_WEIGHTS = {"tag": 1.0, "topic": 1.0, "speaker": 0.5, "text": 1.0}
+# Rows of ``V @ V.T`` materialised at once; bounds memory to BLOCK_ROWS x talks.
+BLOCK_ROWS = 256
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from how in into is it its of on or our the this to we what when why with".split()
+)
+
+Vector = Dict[str, float]
+
+_MEMO: Dict[str, Dict[str, List[Tuple[str, float]]]] = {}
+
+
+def _tokens(text: str) -> List[str]:
+    return [token for token in _TOKEN.findall(text.lower()) if len(token) > 2 and token not in _STOPWORDS]
+
+
+def _label_features(talk: macros.Talk) -> Vector:
+    features: Vector = {}
+    for kind, values in (("tag", talk.tags), ("topic", talk.topics), ("speaker", talk.speakers)):
+        for value in values or []:
+            features[f"{kind}:{str(value).lower()}"] = FIELD_WEIGHTS[kind]
+    return features
+
+
+def _text(talk: macros.Talk) -> str:
+    return " ".join([talk.title or "", talk.abstract or "", *(talk.outline or [])])
+
+
+def snapshot_hash(talks: Iterable[macros.Talk]) -> str:
+    """Hash everything that feeds the similarity model."""
+    digest = hashlib.sha256()
+    for talk in talks:
+        payload = [talk.slug, sorted(_label_features(talk)), _text(talk)]
+        digest.update(json.dumps(payload, ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_vectors(talks: List[macros.Talk]) -> List[Vector]:
+    """Return one L2-normalised sparse vector per talk."""
+    term_counts = [Counter(_tokens(_text(talk))) for talk in talks]
+    document_frequency: Counter = Counter()
+    for counts in term_counts:
+        document_frequency.update(counts.keys())
+    total = len(talks)
+    cutoff = max(1, int(total * MAX_TERM_SHARE))
+
+    vectors: List[Vector] = []
+    for talk, counts in zip(talks, term_counts):
+        vector = _label_features(talk)
+        length = sum(counts.values()) or 1
+        for term, count in counts.items():
+            frequency = document_frequency[term]
+            if total > 2 and frequency > cutoff:
+                continue
+            idf = math.log((1 + total) / (1 + frequency)) + 1
+            vector[f"text:{term}"] = FIELD_WEIGHTS["text"] * (count / length) * idf
+        norm = math.sqrt(sum(weight * weight for weight in vector.values())) or 1.0
+        vectors.append({feature: weight / norm for feature, weight in vector.items()})
+    return vectors
+
+
+def to_matrix(vectors: List[Vector]) -> sparse.csr_matrix:
+    """Stack the sparse vectors into a CSR matrix with one row per talk."""
+    columns: Dict[str, int] = {}
+    indptr, indices, data = [0], [], []
+    for vector in vectors:
+        for feature, weight in vector.items():
+            indices.append(columns.setdefault(feature, len(columns)))
+            data.append(weight)
+        indptr.append(len(indices))
+    shape = (len(vectors), max(len(columns), 1))
+    return sparse.csr_matrix((np.array(data, dtype=float), indices, indptr), shape=shape)
+
+
+def top_k_neighbours(vectors: List[Vector], k: int = DEFAULT_TOP_K) -> List[List[Tuple[int, float]]]:
+    """Cosine top-k per row from the sparse product ``V @ V.T``.
+
+    The product runs in scipy a block of rows at a time, so a label that every
+    talk shares costs one dense block per ``BLOCK_ROWS`` talks rather than a
+    Python loop over every pair. Ties go to the lower row index; pairs with no
+    overlap (score 0) are never returned.
+    """
+    matrix = to_matrix(vectors)
+    transposed = matrix.T.tocsr()
+    total = matrix.shape[0]
+    order = np.arange(total)
+    neighbours: List[List[Tuple[int, float]]] = []
+    for start in range(0, total, BLOCK_ROWS):
+        stop = min(start + BLOCK_ROWS, total)
+        scores = np.round((matrix[start:stop] @ transposed).toarray(), 6)
+        scores[np.arange(stop - start), np.arange(start, stop)] = 0.0
+        candidates = min(k, total)
+        if candidates < total:
+            # Keep every column tied with the k-th best so the tie-break below is exact.
+            kth = -np.partition(-scores, candidates - 1, axis=1)[:, candidates - 1 : candidates]
+            scores = np.where(scores >= kth, scores, 0.0)
+        ranked = np.lexsort((np.broadcast_to(order, scores.shape), -scores), axis=1)[:, :k]
+        for row, columns in enumerate(ranked):
+            neighbours.append([(int(col), float(scores[row, col])) for col in columns if scores[row, col] > 0])
+    return neighbours
+
+
+def compute_related(
+    talks: List[macros.Talk],
+    cache_dir: Optional[Path] = None,
+    k: int = DEFAULT_TOP_K,
+) -> Dict[str, List[Tuple[str, float]]]:
+    """Return ``slug -> [(related slug, score), ...]``, cached by snapshot hash.
+
+    Results are memoised in-process and, when ``cache_dir`` is given, persisted
+    as JSON so unchanged content skips the similarity pass on the next build.
+    Reused files have their mtime bumped, and files no build has used for a
+    week are pruned, as for the precompression cache.
+    """
+    talks = [talk for talk in talks if talk.slug]
+    key = f"{snapshot_hash(talks)}-k{k}"
+    if key in _MEMO:
+        return _MEMO[key]
+
+    cache_path = cache_dir / f"{key}.json" if cache_dir else None
+    if cache_path is not None and cache_path.exists():
+        stored = json.loads(cache_path.read_text(encoding="utf-8"))
+        related = {slug: [(other, score) for other, score in pairs] for slug, pairs in stored.items()}
+        os.utime(cache_path)
+    else:
+        neighbours = top_k_neighbours(build_vectors(talks), k)
+        related = {
+            talk.slug: [(talks[other].slug, score) for other, score in pairs if score > 0]
+            for talk, pairs in zip(talks, neighbours)
+        }
+        if cache_path is not None:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(related, sort_keys=True), encoding="utf-8")
+    if cache_dir is not None:
+        prune_cache(cache_dir)
+    _MEMO[key] = related
+    return related
+
+
+def render_related_section(talks: List[macros.Talk], page_src: str) -> str:
+    """Return the Markdown "Related talks" section for the page at ``page_src``."""
+    lines = ["## Related talks", ""]
+    for talk in talks:
+        label = f"{talk.title} ({macros._format_date(talk)})"
+        if talk.link:
+            lines.append(f"- [{label}]({macros._relative_link(talk.link, page_src)})")
+        else:
+            lines.append(f"- {label}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,68 @@
+"""Content-hash manifest of the built site and the delta between two manifests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+MANIFEST_NAME = "site-manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestDiff:
+    """Paths that differ between two builds, each list sorted."""
+
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def unchanged(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    @property
+    def upload(self) -> List[str]:
+        """Paths a mirror has to (re)upload: everything added or changed."""
+        return sorted(self.added + self.changed)
+
+
+def build_manifest(site_dir: Path) -> Dict[str, str]:
+    """Map every file under ``site_dir`` (except the manifest itself) to its SHA-256."""
+    manifest: Dict[str, str] = {}
+    for path in sorted(site_dir.rglob("*")):
+        if not path.is_file():
+            continue
+        relative = path.relative_to(site_dir).as_posix()
+        if relative == MANIFEST_NAME:
+            continue
+        manifest[relative] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return manifest
+
+
+def write_manifest(site_dir: Path) -> Dict[str, str]:
+    files = build_manifest(site_dir)
+    payload = {"version": MANIFEST_VERSION, "files": files}
+    (site_dir / MANIFEST_NAME).write_text(json.dumps(payload, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+    return files
+
+
+def load_manifest(path: Path) -> Dict[str, str]:
+    """Read a manifest file; a missing or empty file counts as an empty site."""
+    if not path.exists():
+        return {}
+    text = path.read_text(encoding="utf-8").strip()
+    if not text:
+        return {}
+    return dict(json.loads(text).get("files") or {})
+
+
+def diff_manifests(old: Dict[str, str], new: Dict[str, str]) -> ManifestDiff:
+    return ManifestDiff(
+        added=sorted(path for path in new if path not in old),
+        changed=sorted(path for path in new if path in old and old[path] != new[path]),
+        removed=sorted(path for path in old if path not in new),
+    )
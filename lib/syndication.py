@@ -0,0 +1,248 @@
+"""Stream Atom/RSS feeds and a sitemap to disk with ``XMLGenerator``."""
+
+from __future__ import annotations
+
+import gzip
+import shutil
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.utils import format_datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+from xml.sax.saxutils import XMLGenerator
+
+from lib.content_history import ContentHistory, content_hash
+from lib.taxonomy import assign_slugs
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+FEED_DIR_NAME = "feeds"
+FEED_LIMIT = 50
+
+
+@dataclass
+class FeedEntry:
+    """One item in a feed."""
+
+    title: str
+    url: str
+    published: datetime
+    updated: datetime
+    summary: Optional[str] = None
+    authors: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+
+
+@contextmanager
+def _xml_stream(path: Path) -> Iterator[XMLGenerator]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        writer = XMLGenerator(handle, encoding="utf-8", short_empty_elements=True)
+        writer.startDocument()
+        yield writer
+        writer.endDocument()
+        handle.write("\n")
+
+
+def _element(writer: XMLGenerator, name: str, text: Optional[str] = None, attrs: Optional[Dict[str, str]] = None) -> None:
+    writer.startElement(name, attrs or {})
+    if text:
+        writer.characters(text)
+    writer.endElement(name)
+
+
+def write_atom_feed(
+    path: Path,
+    title: str,
+    feed_url: str,
+    site_url: str,
+    entries: Iterable[FeedEntry],
+    updated: datetime,
+) -> int:
+    """Stream an Atom feed to ``path`` one entry at a time and return the entry count."""
+    count = 0
+    with _xml_stream(path) as writer:
+        writer.startElement("feed", {"xmlns": ATOM_NS})
+        _element(writer, "title", title)
+        _element(writer, "id", feed_url)
+        _element(writer, "link", attrs={"rel": "self", "href": feed_url})
+        _element(writer, "link", attrs={"href": site_url})
+        _element(writer, "updated", updated.isoformat())
+        for entry in entries:
+            writer.startElement("entry", {})
+            _element(writer, "title", entry.title)
+            _element(writer, "id", entry.url)
+            _element(writer, "link", attrs={"href": entry.url})
+            _element(writer, "published", entry.published.isoformat())
+            _element(writer, "updated", entry.updated.isoformat())
+            for author in entry.authors:
+                writer.startElement("author", {})
+                _element(writer, "name", author)
+                writer.endElement("author")
+            for category in entry.categories:
+                _element(writer, "category", attrs={"term": category})
+            if entry.summary:
+                _element(writer, "summary", entry.summary)
+            writer.endElement("entry")
+            count += 1
+        writer.endElement("feed")
+    return count
+
+
+def write_rss_feed(
+    path: Path,
+    title: str,
+    site_url: str,
+    description: str,
+    entries: Iterable[FeedEntry],
+    updated: datetime,
+) -> int:
+    """Stream an RSS 2.0 feed to ``path`` one item at a time and return the item count."""
+    count = 0
+    with _xml_stream(path) as writer:
+        writer.startElement("rss", {"version": "2.0"})
+        writer.startElement("channel", {})
+        _element(writer, "title", title)
+        _element(writer, "link", site_url)
+        _element(writer, "description", description)
+        _element(writer, "lastBuildDate", format_datetime(updated))
+        for entry in entries:
+            writer.startElement("item", {})
+            _element(writer, "title", entry.title)
+            _element(writer, "link", entry.url)
+            _element(writer, "guid", entry.url, {"isPermaLink": "true"})
+            _element(writer, "pubDate", format_datetime(entry.published))
+            for category in entry.categories:
+                _element(writer, "category", category)
+            if entry.summary:
+                _element(writer, "description", entry.summary)
+            writer.endElement("item")
+            count += 1
+        writer.endElement("channel")
+        writer.endElement("rss")
+    return count
+
+
+def write_sitemap(path: Path, urls: Iterable[tuple]) -> int:
+    """Stream ``(loc, lastmod date)`` pairs into ``path`` and a gzipped copy beside it."""
+    count = 0
+    with _xml_stream(path) as writer:
+        writer.startElement("urlset", {"xmlns": SITEMAP_NS})
+        for loc, lastmod in urls:
+            writer.startElement("url", {})
+            _element(writer, "loc", loc)
+            if lastmod:
+                _element(writer, "lastmod", lastmod)
+            writer.endElement("url")
+            count += 1
+        writer.endElement("urlset")
+    with path.open("rb") as source, gzip.GzipFile(path.with_name(path.name + ".gz"), "wb", mtime=0) as target:
+        shutil.copyfileobj(source, target)
+    return count
+
+
+def _talk_entries(talks, page_index, history: ContentHistory, data_date: datetime) -> List[FeedEntry]:
+    entries: List[FeedEntry] = []
+    for talk in talks:
+        page = page_index.get(talk.link or "")
+        if page is None:
+            continue
+        record = history.get(f"page:{talk.link}") or {}
+        published = datetime.fromisoformat(record.get("first_seen", data_date.isoformat()))
+        updated = datetime.fromisoformat(record.get("lastmod", data_date.isoformat()))
+        entries.append(
+            FeedEntry(
+                title=talk.title,
+                url=page[0],
+                published=published,
+                updated=updated,
+                summary=talk.abstract,
+                authors=list(talk.speakers),
+                categories=list(talk.tags or talk.topics or []),
+            )
+        )
+    return entries
+
+
+def _recording_entries(talks, page_index, history: ContentHistory, data_date: datetime) -> List[FeedEntry]:
+    entries: List[FeedEntry] = []
+    for talk in talks:
+        if not talk.recording_url or not talk.slug:
+            continue
+        record = history.touch(f"recording:{talk.slug}", content_hash(talk.recording_url), data_date, talk.dt)
+        page = page_index.get(talk.link or "")
+        entries.append(
+            FeedEntry(
+                title=f"Recording: {talk.title}",
+                url=page[0] if page else talk.recording_url,
+                published=datetime.fromisoformat(record["first_seen"]),
+                updated=datetime.fromisoformat(record["lastmod"]),
+                summary=talk.abstract,
+                authors=list(talk.speakers),
+                categories=list(talk.tags or talk.topics or []),
+            )
+        )
+    return entries
+
+
+def _newest(entries: List[FeedEntry], limit: int) -> List[FeedEntry]:
+    return sorted(entries, key=lambda entry: (entry.published, entry.url), reverse=True)[:limit]
+
+
+def publish_feeds(
+    site_dir: Path,
+    site_url: str,
+    site_name: str,
+    talks,
+    page_index: Dict[str, tuple],
+    history: ContentHistory,
+    data_date: datetime,
+) -> Dict[str, int]:
+    """Write the talk, recording and per-tag feeds; return entries written per feed path.
+
+    ``data_date`` is when the schedule data last changed. It dates new
+    recordings and stands in for ``updated`` on empty feeds.
+    """
+    feed_root = site_dir / FEED_DIR_NAME
+    base = site_url.rstrip("/") + "/" if site_url else "/"
+    written: Dict[str, int] = {}
+
+    def atom(name: str, title: str, entries: List[FeedEntry]) -> None:
+        ordered = _newest(entries, FEED_LIMIT)
+        updated = max((entry.updated for entry in ordered), default=data_date)
+        written[name] = write_atom_feed(feed_root / name, title, f"{base}{FEED_DIR_NAME}/{name}", base, ordered, updated)
+
+    talk_entries = _talk_entries(talks, page_index, history, data_date)
+    atom("talks.atom.xml", f"{site_name}: new talks", talk_entries)
+    newest = _newest(talk_entries, FEED_LIMIT)
+    written["talks.rss.xml"] = write_rss_feed(
+        feed_root / "talks.rss.xml",
+        f"{site_name}: new talks",
+        base,
+        f"Newly announced sessions from {site_name}.",
+        newest,
+        max((entry.updated for entry in newest), default=data_date),
+    )
+    atom("recordings.atom.xml", f"{site_name}: new recordings", _recording_entries(talks, page_index, history, data_date))
+
+    by_tag: Dict[str, List[FeedEntry]] = {}
+    for entry in talk_entries:
+        for category in entry.categories:
+            by_tag.setdefault(category, []).append(entry)
+    # Same collision-safe slugs as the tag pages, so "C++" and "C#" get separate feeds.
+    slugs = assign_slugs(by_tag)
+    for tag, entries in sorted(by_tag.items()):
+        atom(f"tags/{slugs[tag]}.atom.xml", f"{site_name}: {tag}", entries)
+    return written
+
+
+def publish_sitemap(site_dir: Path, page_index: Dict[str, tuple], history: ContentHistory, data_date: datetime) -> int:
+    """Replace the MkDocs sitemap with one whose ``lastmod`` follows content-hash history."""
+
+    def urls() -> Iterator[tuple]:
+        for src_path, (url, _digest) in sorted(page_index.items(), key=lambda item: item[1][0]):
+            record = history.get(f"page:{src_path}") or {}
+            yield url, record.get("lastmod", data_date.isoformat())[:10]
+
+    return write_sitemap(site_dir / "sitemap.xml", urls())
@@ -0,0 +1,100 @@
+"""Single-pass aggregation of dashboard statistics over the talk snapshot."""
+
+from __future__ import annotations
+
+import re
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import macros
+
+_LEADING_MINUTES = re.compile(r"^\s*(\d+(?:\.\d+)?)")
+
+
+@dataclass
+class TalkStats:
+    """Aggregated counters for one snapshot of talks."""
+
+    delivered: int = 0
+    upcoming_speakers: int = 0
+    recorded_minutes: int = 0
+    tag_counts: Counter = field(default_factory=Counter)
+    speaker_counts: Counter = field(default_factory=Counter)
+    year_counts: Counter = field(default_factory=Counter)
+    tag_years: Dict[str, Counter] = field(default_factory=dict)
+
+    @property
+    def top_tag(self) -> str:
+        ranked = self.tag_counts.most_common(1)
+        return ranked[0][0] if ranked else "N/A"
+
+    @property
+    def recorded_hours(self) -> float:
+        return round(self.recorded_minutes / 60, 1)
+
+    def top_tags(self, count: int = 5) -> List[Tuple[str, int]]:
+        return self.tag_counts.most_common(count)
+
+    def top_speakers(self, count: int = 5) -> List[Tuple[str, int]]:
+        return self.speaker_counts.most_common(count)
+
+    def tag_trend(self, tag: str) -> List[Tuple[int, int]]:
+        return sorted(self.tag_years.get(tag, Counter()).items())
+
+    def yearly_histogram(self) -> List[Tuple[int, int]]:
+        """Return ``(year, count)`` pairs for every year in range, including empty ones."""
+        if not self.year_counts:
+            return []
+        first, last = min(self.year_counts), max(self.year_counts)
+        counts = array("I", (self.year_counts.get(year, 0) for year in range(first, last + 1)))
+        return [(first + offset, value) for offset, value in enumerate(counts)]
+
+
+def duration_minutes(value: Any) -> Optional[int]:
+    """Read a talk duration as whole minutes; ``"45 min"`` gives 45, unusable values ``None``.
+
+    Page front matter is not validated and wins over the schedule, so anything
+    can arrive here.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        minutes = int(value)
+    else:
+        match = _LEADING_MINUTES.match(str(value or ""))
+        if not match:
+            return None
+        minutes = int(float(match.group(1)))
+    return minutes if minutes > 0 else None
+
+
+def aggregate_stats(talks: Iterable["macros.Talk"], now: datetime) -> TalkStats:
+    """Compute every dashboard statistic in a single pass over ``talks``."""
+    stats = TalkStats()
+    upcoming_names = set()
+    for talk in talks:
+        labels: List[str] = [*(talk.tags or []), *(talk.topics or [])]
+        stats.tag_counts.update(labels)
+        stats.speaker_counts.update(name for name in talk.speakers if name)
+
+        year: Optional[int] = talk.dt.year if talk.dt else None
+        if year is not None:
+            stats.year_counts[year] += 1
+            for label in labels:
+                stats.tag_years.setdefault(label, Counter())[year] += 1
+
+        if not talk.dt:
+            continue
+        if talk.dt >= now:
+            upcoming_names.update(name for name in talk.speakers if name)
+        else:
+            stats.delivered += 1
+            minutes = duration_minutes(talk.duration) if talk.recording_url else None
+            if minutes:
+                stats.recorded_minutes += minutes
+    stats.upcoming_speakers = len(upcoming_names)
+    return stats
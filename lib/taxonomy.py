@@ -0,0 +1,155 @@
+"""Generate per-speaker, per-tag and per-topic pages from a single grouping pass."""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import macros
+from lib.generated_talks import GENERATED_DIR_NAME, register_generated_file, write_if_changed
+
+TAXONOMY_TITLES = {"speakers": "Speakers", "tags": "Tags", "topics": "Topics"}
+# Spelled out so "C", "C++" and "C#" get distinct, readable slugs.
+_SYMBOL_WORDS = {"+": " plus ", "#": " sharp ", "&": " and ", "@": " at "}
+# Slugs taken by the pages every kind generates for itself.
+_RESERVED_SLUGS = frozenset({"index"})
+
+
+def term_slug(label: str) -> str:
+    """Readable slug for a label; distinct labels can still collide (``SQL``/``sql``)."""
+    spelled = "".join(_SYMBOL_WORDS.get(char, char) for char in label.lower())
+    return re.sub(r"[^a-z0-9]+", "-", spelled).strip("-") or "term"
+
+
+def assign_slugs(labels: Iterable[str]) -> Dict[str, str]:
+    """Map each label to a unique slug.
+
+    Labels whose readable slug is shared, or reserved (``index``), get a short
+    hash of the label appended, so the result does not depend on the order
+    labels are seen in.
+    """
+    by_slug: Dict[str, List[str]] = {}
+    for label in labels:
+        by_slug.setdefault(term_slug(label), []).append(label)
+    slugs: Dict[str, str] = {}
+    for slug, group in by_slug.items():
+        for label in group:
+            if len(group) == 1 and slug not in _RESERVED_SLUGS:
+                slugs[label] = slug
+            else:
+                slugs[label] = f"{slug}-{hashlib.sha1(label.encode('utf-8')).hexdigest()[:6]}"
+    return slugs
+
+
+@dataclass
+class Taxonomy:
+    """Talks grouped by speaker, tag and topic, newest first within each group."""
+
+    groups: Dict[str, Dict[str, List[macros.Talk]]] = field(
+        default_factory=lambda: {kind: {} for kind in TAXONOMY_TITLES}
+    )
+    speaker_details: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    slugs: Dict[str, Dict[str, str]] = field(default_factory=dict)
+
+    def src_path(self, kind: str, label: str) -> Optional[str]:
+        """Source path of the page for ``label``, or ``None`` if no talk carries it."""
+        slug = self.slugs.get(kind, {}).get(label)
+        return f"{kind}/{slug}.md" if slug else None
+
+
+def group_talks(talks: Iterable[macros.Talk]) -> Taxonomy:
+    """Bucket talks by speaker, tag and topic in one pass, preserving input order."""
+    taxonomy = Taxonomy()
+    speakers, tags, topics = (taxonomy.groups[kind] for kind in ("speakers", "tags", "topics"))
+    for talk in talks:
+        for name in talk.speakers:
+            speakers.setdefault(name, []).append(talk)
+        for entry in talk.speaker_details:
+            name = entry.get("name")
+            if not name:
+                continue
+            details = taxonomy.speaker_details.setdefault(str(name), {})
+            for key in ("bio", "avatar"):
+                if entry.get(key) and key not in details:
+                    details[key] = entry[key]
+        for tag in talk.tags:
+            tags.setdefault(tag, []).append(talk)
+        for topic in talk.topics:
+            topics.setdefault(topic, []).append(talk)
+    taxonomy.slugs = {kind: assign_slugs(terms) for kind, terms in taxonomy.groups.items()}
+    return taxonomy
+
+
+def render_talk_terms(taxonomy: Taxonomy, talk: macros.Talk, page_src: str) -> str:
+    """Return a "Filed under" line linking a talk's speakers, tags and topics, or ``""``."""
+    links = []
+    for kind, labels in (("speakers", talk.speakers), ("tags", talk.tags), ("topics", talk.topics)):
+        for label in labels or []:
+            target = taxonomy.src_path(kind, label)
+            if target:
+                links.append(f"[{label}]({macros._relative_link(target, page_src)})")
+    return f"**Filed under:** {' · '.join(links)}\n" if links else ""
+
+
+def _term_page(kind: str, label: str, src_path: str, talks: List[macros.Talk], details: Dict[str, Any]) -> str:
+    lines = [f"# {label}", ""]
+    if details.get("avatar"):
+        avatar = macros._relative_link(str(details["avatar"]), src_path)
+        lines.extend([f'<img class="speaker-avatar" src="{avatar}" alt="{label}">', ""])
+    if details.get("bio"):
+        lines.extend([str(details["bio"]), ""])
+    label_noun = "talk" if len(talks) == 1 else "talks"
+    lines.extend([f"{len(talks)} {label_noun}.", ""])
+    lines.append(macros.render_talk_list(talks, src_path))
+    lines.extend(["", f"[All {TAXONOMY_TITLES[kind].lower()}](index.md)"])
+    return "\n".join(lines).strip() + "\n"
+
+
+def _index_page(kind: str, terms: Dict[str, List[macros.Talk]], slugs: Dict[str, str]) -> str:
+    lines = [f"# {TAXONOMY_TITLES[kind]}", ""]
+    if not terms:
+        lines.append("Nothing here yet.")
+    for label in sorted(terms, key=str.lower):
+        count = len(terms[label])
+        lines.append(f"- [{label}]({slugs[label]}.md) ({count} {'talk' if count == 1 else 'talks'})")
+    return "\n".join(lines).strip() + "\n"
+
+
+def build_taxonomy_pages(taxonomy: Taxonomy) -> Dict[str, str]:
+    """Return ``src_path -> Markdown`` for every taxonomy index and term page."""
+    pages: Dict[str, str] = {}
+    for kind, terms in taxonomy.groups.items():
+        pages[f"{kind}/index.md"] = _index_page(kind, terms, taxonomy.slugs[kind])
+        for label, talks in terms.items():
+            details = taxonomy.speaker_details.get(label, {}) if kind == "speakers" else {}
+            src_path = taxonomy.src_path(kind, label)
+            pages[src_path] = _term_page(kind, label, src_path, talks, details)
+    return pages
+
+
+def generate_taxonomy_pages(
+    taxonomy: Taxonomy,
+    docs_dir: Path,
+    site_dir: Path,
+    files,
+    use_directory_urls: bool,
+    dir_name: str = GENERATED_DIR_NAME,
+) -> Tuple[List[str], int]:
+    """Register taxonomy pages; return their source paths and how many were rewritten.
+
+    Pages whose content hash matches the copy already on disk are left untouched.
+    """
+    generated_root = docs_dir / dir_name
+    generated: List[str] = []
+    written = 0
+    for src_path, content in build_taxonomy_pages(taxonomy).items():
+        if (docs_dir / src_path).exists():
+            continue
+        generated_path = generated_root / src_path
+        written += write_if_changed(generated_path, content)
+        register_generated_file(files, src_path, docs_dir, site_dir, use_directory_urls, generated_path)
+        generated.append(src_path)
+    return generated, written
@@ -0,0 +1,70 @@
+"""Sorted timeline index over dated talks with bisect-based range queries."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Iterable, List, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import macros
+
+# Widest UTC offset in use; month windows are padded by this much before the
+# local-date filter so talks near midnight land in their local month.
+_MAX_OFFSET = timedelta(hours=14)
+
+
+def _epoch(instant: datetime) -> float:
+    if instant.tzinfo is None:
+        instant = instant.replace(tzinfo=timezone.utc)
+    return instant.timestamp()
+
+
+def month_bounds(year: int, month: int) -> Tuple[datetime, datetime]:
+    """Return the UTC ``[start, end)`` instants of a calendar month."""
+    start = datetime(year, month, 1, tzinfo=timezone.utc)
+    end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+    return start, end
+
+
+class TimelineIndex:
+    """Dated talks sorted by UTC epoch; undated talks are kept aside."""
+
+    def __init__(self, talks: Iterable["macros.Talk"]) -> None:
+        dated = []
+        self.undated: List["macros.Talk"] = []
+        for position, talk in enumerate(talks):
+            if talk.dt:
+                dated.append((talk.dt.timestamp(), position, talk))
+            else:
+                self.undated.append(talk)
+        dated.sort(key=lambda entry: entry[:2])
+        self.epochs: List[float] = [entry[0] for entry in dated]
+        self.talks: List["macros.Talk"] = [entry[2] for entry in dated]
+
+    def __len__(self) -> int:
+        return len(self.talks)
+
+    def between(self, start: datetime, end: datetime) -> List["macros.Talk"]:
+        """Return talks starting in ``[start, end)``, oldest first."""
+        low = bisect_left(self.epochs, _epoch(start))
+        high = bisect_left(self.epochs, _epoch(end))
+        return self.talks[low:high]
+
+    def since(self, instant: datetime) -> List["macros.Talk"]:
+        """Return talks starting at or after ``instant``, oldest first."""
+        return self.talks[bisect_left(self.epochs, _epoch(instant)) :]
+
+    def before(self, instant: datetime) -> List["macros.Talk"]:
+        """Return talks starting before ``instant``, oldest first."""
+        return self.talks[: bisect_left(self.epochs, _epoch(instant))]
+
+    def in_month(self, year: int, month: int) -> List["macros.Talk"]:
+        """Return talks whose local start date falls in the given month."""
+        start, end = month_bounds(year, month)
+        window = self.between(start - _MAX_OFFSET, end + _MAX_OFFSET)
+        return [talk for talk in window if (talk.dt.year, talk.dt.month) == (year, month)]
+
+    def months(self) -> List[Tuple[int, int]]:
+        """Return the distinct local ``(year, month)`` pairs that have talks, oldest first."""
+        return sorted({(talk.dt.year, talk.dt.month) for talk in self.talks})
@@ -1,13 +1,21 @@
-﻿import re
-from dataclasses import dataclass, field
+﻿import json
+import logging
+import posixpath
+from dataclasses import dataclass, field, fields
 from datetime import datetime, time as dtime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import yaml
+from lib.build_clock import build_clock, freeze_build_clock
+from lib.front_matter import FRONT_MATTER
+from lib.parse_cache import PARSE_CACHE, SNAPSHOTS
 from lib.schedule_validation import validate_schedule_data
+from lib.talk_stats import TalkStats, aggregate_stats
+from lib.timeline import TimelineIndex
 
 ROOT = Path(__file__).resolve().parent
+log = logging.getLogger("mkdocs.macros")
 DOCS = ROOT / "docs"
 
 SCHEDULE_PATHS = [
@@ -16,6 +24,41 @@ SCHEDULE_PATHS = [
 ]
 
 TIME_SEP = "\u2013"
+ARCHIVE_FILE_NAME = "archive.json"
+
+
+@dataclass(frozen=True)
+class SiteRoots:
+    """Where one site (tenant) keeps its docs and schedule files."""
+
+    root: Path
+    docs: Path
+    schedule_paths: Tuple[Path, ...]
+
+    @property
+    def archive_path(self) -> Path:
+        """Frozen archive snapshot, kept beside the primary schedule file."""
+        return self.schedule_paths[0].parent / ARCHIVE_FILE_NAME
+
+
+DEFAULT_ROOTS = SiteRoots(ROOT, DOCS, tuple(SCHEDULE_PATHS))
+
+
+def roots_from_config(config) -> SiteRoots:
+    """Derive the site roots from a MkDocs config.
+
+    The project root is the directory holding the config file. ``extra.schedule``
+    may point at a tenant-specific schedule file, relative to that root.
+    """
+    config_file = config.get("config_file_path")
+    root = Path(config_file).resolve().parent if config_file else ROOT
+    docs = Path(config.get("docs_dir") or root / "docs").resolve()
+    schedule = (config.get("extra") or {}).get("schedule")
+    if schedule:
+        schedule_paths: Tuple[Path, ...] = ((root / schedule).resolve(),)
+    else:
+        schedule_paths = (root / "data" / "schedule.yml", root / "schedule.yml")
+    return SiteRoots(root, docs, schedule_paths)
 
 
 @dataclass
@@ -43,6 +86,74 @@ class Talk:
     date_str: Optional[str] = None
     time_str: Optional[str] = None
 
+    source: Optional[str] = None
+    source_line: Optional[int] = None
+
+    @property
+    def origin(self) -> Optional[str]:
+        if self.source and self.source_line:
+            return f"{self.source}:{self.source_line}"
+        return self.source
+
+    def provenance(self, name: str) -> Optional[str]:
+        """Return where the value of ``name`` was read from."""
+        return self.origin
+
+
+_DERIVED_FIELDS = ("dt", "iso_start", "date_str", "time_str")
+_OVERLAY_FIELDS = tuple(
+    item.name
+    for item in fields(Talk)
+    if item.name not in _DERIVED_FIELDS + ("slug", "source", "source_line")
+)
+
+
+class TalkOverlay:
+    """Read-only view of a scheduled talk with its hand-written page layered on top.
+
+    Fields resolve lazily: the page value wins when it is truthy, otherwise the
+    schedule value is used. Nothing is copied, so the merge costs a single object
+    per talk regardless of how large the lists and dicts underneath are.
+    """
+
+    __slots__ = ("page", "schedule") + _DERIVED_FIELDS
+
+    def __init__(self, page: Talk, schedule: Talk) -> None:
+        self.page = page
+        self.schedule = schedule
+        self.dt = None
+        self.iso_start = None
+        self.date_str = None
+        self.time_str = None
+
+    @property
+    def slug(self) -> Optional[str]:
+        return self.schedule.slug
+
+    @property
+    def origin(self) -> Optional[str]:
+        return self.page.origin
+
+    def _winner(self, name: str) -> Talk:
+        return self.page if getattr(self.page, name) else self.schedule
+
+    def provenance(self, name: str) -> Optional[str]:
+        """Return where the value of ``name`` was read from."""
+        if name == "slug":
+            return self.schedule.origin
+        if name in _DERIVED_FIELDS:
+            return "computed"
+        return self._winner(name).origin
+
+
+def _overlay_property(name: str) -> property:
+    return property(lambda self: getattr(self._winner(name), name))
+
+
+for _name in _OVERLAY_FIELDS:
+    setattr(TalkOverlay, _name, _overlay_property(_name))
+del _name
+
 
 def _safe_zone(tz: Optional[str]):
     try:
@@ -83,6 +194,11 @@ def _mk_dt(date_str: Optional[str], time_str: Optional[str], tz_str: Optional[st
     return datetime(year, month, day, parsed_time.hour, parsed_time.minute, tzinfo=tz)
 
 
+def _cached_parse(kind: str, path: Path, parse: Callable[[Path], Any]) -> Any:
+    """Memoise ``parse(path)`` by file mtime and size, shared by every site in the process."""
+    return PARSE_CACHE.get(kind, path, parse)
+
+
 def _load_yaml(path: Path) -> Any:
     try:
         return yaml.safe_load(path.read_text(encoding="utf-8"))
@@ -90,6 +206,44 @@ def _load_yaml(path: Path) -> Any:
         return None
 
 
+class _LineLoader(yaml.SafeLoader):
+    """SafeLoader that remembers the line each mapping starts on."""
+
+    def __init__(self, stream) -> None:
+        super().__init__(stream)
+        self.lines: Dict[int, int] = {}
+
+    def construct_yaml_map(self, node):
+        data: Dict[Any, Any] = {}
+        self.lines[id(data)] = node.start_mark.line + 1
+        yield data
+        data.update(self.construct_mapping(node))
+
+
+_LineLoader.add_constructor("tag:yaml.org,2002:map", _LineLoader.construct_yaml_map)
+
+
+def _load_yaml_with_lines(path: Path) -> Tuple[Any, Dict[int, int]]:
+    """Load YAML and return it with a map of ``id(mapping)`` to its starting line."""
+    try:
+        loader = _LineLoader(path.read_text(encoding="utf-8"))
+    except Exception:
+        return None, {}
+    try:
+        return loader.get_single_data(), loader.lines
+    except Exception:
+        return None, {}
+    finally:
+        loader.dispose()
+
+
+def _display_path(path: Path, root: Path = ROOT) -> str:
+    try:
+        return path.relative_to(root).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
 def _normalise_speakers(raw: Any) -> (List[str], List[Dict[str, Any]]):
     names: List[str] = []
     details: List[Dict[str, Any]] = []
@@ -147,15 +301,29 @@ def _coerce_tags(raw: Any) -> List[str]:
     return []
 
 
-def _read_schedule() -> List[Talk]:
+def _validate_schedule(path: Path) -> None:
+    def validate(_: Path) -> bool:
+        raw_data, _lines = _cached_parse("yaml", path, _load_yaml_with_lines)
+        validate_schedule_data(raw_data, path)
+        return True
+
+    _cached_parse("validated", path, validate)
+
+
+def _read_schedule(
+    roots: SiteRoots = DEFAULT_ROOTS,
+    skip_slugs: frozenset = frozenset(),
+    skipped: Optional[List[Talk]] = None,
+) -> List[Talk]:
+    """Read the schedule; entries in ``skip_slugs`` go to ``skipped`` (if given) instead."""
     talks: List[Talk] = []
-    for schedule_path in SCHEDULE_PATHS:
+    for schedule_path in roots.schedule_paths:
         if not schedule_path.exists():
             continue
-        raw_data = _load_yaml(schedule_path)
+        raw_data, lines = _cached_parse("yaml", schedule_path, _load_yaml_with_lines)
         if raw_data is None:
             continue
-        validate_schedule_data(raw_data, schedule_path)
+        _validate_schedule(schedule_path)
         data = raw_data or {}
         sections: Dict[str, List[Dict[str, Any]]] = {}
         if isinstance(data, list):
@@ -168,6 +336,9 @@ def _read_schedule() -> List[Talk]:
             for item in sections.get(section, []):
                 if not isinstance(item, dict):
                     continue
+                skip = item.get("slug") in skip_slugs
+                if skip and skipped is None:
+                    continue
                 names, details = _normalise_speakers(item.get("speakers") or item.get("speaker"))
                 talk = Talk(
                     title=str(item.get("title") or ""),
@@ -186,33 +357,37 @@ def _read_schedule() -> List[Talk]:
                     resources=_collect_resources(item),
                     recording_url=item.get("recording_url"),
                     status=item.get("status"),
+                    source=_display_path(schedule_path, roots.root),
+                    source_line=lines.get(id(item)),
                 )
                 if talk.slug and not talk.link:
                     talk.link = f"talks/{talk.slug}.md"
                 elif item.get("link"):
                     talk.link = str(item.get("link"))
-                talks.append(talk)
+                (skipped if skip else talks).append(talk)
         break
     return talks
 
 
 def _front_matter(path: Path) -> Dict[str, Any]:
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n", text, flags=re.S)
-    if not match:
-        return {}
-    try:
-        return yaml.safe_load(match.group(1)) or {}
-    except Exception:
-        return {}
+    entry = FRONT_MATTER.get(path)
+    return entry.meta if entry else {}
 
 
-def _read_talk_pages() -> List[Talk]:
+def _read_talk_pages(
+    roots: SiteRoots = DEFAULT_ROOTS,
+    skip_slugs: frozenset = frozenset(),
+    skipped: Optional[List[Talk]] = None,
+) -> List[Talk]:
+    """Read hand-written talk pages; stems in ``skip_slugs`` go to ``skipped`` (if given) instead."""
     talks: List[Talk] = []
-    talks_dir = DOCS / "talks"
+    talks_dir = roots.docs / "talks"
     if not talks_dir.exists():
         return talks
-    for md_file in talks_dir.glob("*.md"):
+    for md_file in sorted(talks_dir.glob("*.md")):
+        skip = md_file.stem in skip_slugs
+        if skip and skipped is None:
+            continue
         fm = _front_matter(md_file)
         if not fm:
             continue
@@ -228,45 +403,83 @@ def _read_talk_pages() -> List[Talk]:
             tags=_coerce_tags(fm.get("tags")),
             topics=_coerce_tags(fm.get("topics")),
             slug=md_file.stem,
-            link=str(md_file.relative_to(DOCS)).replace("\\", "/"),
+            link=str(md_file.relative_to(roots.docs)).replace("\\", "/"),
             thumbnail=fm.get("thumbnail"),
             abstract=fm.get("abstract"),
             outline=_normalise_outline(fm.get("outline")),
             resources=_collect_resources(fm),
             recording_url=fm.get("recording_url"),
             status=fm.get("status"),
+            source=_display_path(md_file, roots.root),
         )
-        talks.append(talk)
+        (skipped if skip else talks).append(talk)
     return talks
 
 
+def _load_archive(path: Path, root: Path = ROOT) -> Tuple[Tuple[Talk, ...], Dict[str, Dict[str, str]]]:
+    """Read a frozen archive snapshot: decorated talks plus their pre-rendered pages.
+
+    Records without a string ``slug`` are skipped with a warning.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return (), {}
+    source = _display_path(path, root)
+    talks: List[Talk] = []
+    rendered: Dict[str, Dict[str, str]] = {}
+    records = payload.get("talks") if isinstance(payload, dict) else None
+    for index, record in enumerate(records or []):
+        if not isinstance(record, dict) or not isinstance(record.get("slug"), str) or not record["slug"]:
+            log.warning("%s: skipping archive record %d without a slug", source, index)
+            continue
+        data = {name: record.get(name) for name in ("slug",) + _OVERLAY_FIELDS if record.get(name) is not None}
+        talks.append(_decorate(Talk(**data, source=source)))
+        rendered[record["slug"]] = {"markdown": record.get("markdown", ""), "html": record.get("html", "")}
+    return tuple(talks), rendered
+
+
+def _read_archive(roots: SiteRoots = DEFAULT_ROOTS) -> Tuple[Tuple[Talk, ...], Dict[str, Dict[str, str]]]:
+    """Return the archived talks for ``roots``; the result is shared and must be treated as read-only."""
+    if not roots.archive_path.exists():
+        return (), {}
+    return _cached_parse("archive", roots.archive_path, lambda path: _load_archive(path, roots.root))
+
+
+def _warn_on_archive_drift(archived: Iterable[Talk], current: Iterable[Talk]) -> None:
+    """Warn about archived talks whose schedule entry or page was edited after freezing.
+
+    The archive is read-only, so such edits (say, a ``recording_url`` added
+    later) would otherwise be dropped without a trace.
+    """
+    frozen = {talk.slug: talk for talk in archived}
+    for talk in current:
+        record = frozen.get(talk.slug)
+        if record is None:
+            continue
+        talk = _decorate(talk) if isinstance(talk, Talk) else talk
+        changed = [
+            name
+            for name in _OVERLAY_FIELDS
+            if (getattr(talk, name) or None) != (getattr(record, name) or None)
+        ]
+        if changed:
+            log.warning(
+                "Archived talk '%s' differs from %s in %s; the archive is frozen, so edit %s to apply it",
+                talk.slug,
+                talk.origin,
+                ", ".join(changed),
+                record.source,
+            )
+
+
 def _merge_schedule_and_pages(schedule_talks: List[Talk], page_talks: List[Talk]) -> List[Talk]:
     by_slug: Dict[str, Talk] = {talk.slug: talk for talk in page_talks if talk.slug}
     merged: List[Talk] = []
     seen: set = set()
     for talk in schedule_talks:
         if talk.slug and talk.slug in by_slug:
-            page_talk = by_slug[talk.slug]
-            combined = Talk(
-                title=page_talk.title or talk.title,
-                date=page_talk.date or talk.date,
-                time=page_talk.time or talk.time,
-                timezone=page_talk.timezone or talk.timezone,
-                duration=page_talk.duration or talk.duration,
-                speakers=page_talk.speakers or talk.speakers,
-                speaker_details=page_talk.speaker_details or talk.speaker_details,
-                tags=page_talk.tags or talk.tags,
-                topics=page_talk.topics or talk.topics,
-                slug=talk.slug,
-                link=page_talk.link or talk.link,
-                thumbnail=page_talk.thumbnail or talk.thumbnail,
-                abstract=page_talk.abstract or talk.abstract,
-                outline=page_talk.outline or talk.outline,
-                resources=page_talk.resources or talk.resources,
-                recording_url=page_talk.recording_url or talk.recording_url,
-                status=page_talk.status or talk.status,
-            )
-            merged.append(combined)
+            merged.append(TalkOverlay(by_slug[talk.slug], talk))
             seen.add(talk.slug)
         else:
             merged.append(talk)
@@ -301,63 +514,130 @@ def _format_time(talk: Talk) -> str:
     return talk.time or "TBA"
 
 
-def _build() -> Dict[str, Any]:
-    schedule_talks = _read_schedule()
-    page_talks = _read_talk_pages()
+def _snapshot_key(roots: SiteRoots = DEFAULT_ROOTS) -> Tuple[Tuple[str, int, int], ...]:
+    """Fingerprint the schedule and talk page sources by path, mtime and size."""
+    sources: List[Path] = [path for path in roots.schedule_paths + (roots.archive_path,) if path.exists()]
+    talks_dir = roots.docs / "talks"
+    if talks_dir.exists():
+        sources.extend(sorted(talks_dir.glob("*.md")))
+    key = []
+    for path in sources:
+        stat = path.stat()
+        key.append((str(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+def _build(roots: SiteRoots = DEFAULT_ROOTS) -> Dict[str, Any]:
+    key = (_snapshot_key(roots), build_clock())
+    snapshot = SNAPSHOTS.setdefault((roots.root, roots.docs) + roots.schedule_paths, {})
+    if snapshot.get("key") != key:
+        snapshot["data"] = _build_snapshot(roots)
+        snapshot["key"] = key
+    return snapshot["data"]
+
+
+def _build_snapshot(roots: SiteRoots = DEFAULT_ROOTS) -> Dict[str, Any]:
+    archived, archive_pages = _read_archive(roots)
+    archived_slugs = frozenset(talk.slug for talk in archived)
+    stale_schedule: List[Talk] = []
+    stale_pages: List[Talk] = []
+    schedule_talks = _read_schedule(roots, archived_slugs, stale_schedule if archived_slugs else None)
+    page_talks = _read_talk_pages(roots, archived_slugs, stale_pages if archived_slugs else None)
+    _warn_on_archive_drift(archived, _merge_schedule_and_pages(stale_schedule, stale_pages))
     talks = [_decorate(talk) for talk in _merge_schedule_and_pages(schedule_talks, page_talks)]
+    talks.extend(archived)
 
-    now = datetime.now(timezone.utc)
-
-    def future_key(item: Talk) -> datetime:
-        return item.dt or datetime.max.replace(tzinfo=timezone.utc)
+    now = build_clock()
+    timeline = TimelineIndex(talks)
 
-    def past_key(item: Talk) -> datetime:
-        return item.dt or datetime.min.replace(tzinfo=timezone.utc)
+    upcoming = timeline.since(now)
+    past = timeline.before(now)[::-1]
 
-    upcoming = sorted([talk for talk in talks if talk.dt and talk.dt >= now], key=future_key)
-    past = sorted([talk for talk in talks if talk.dt and talk.dt < now], key=past_key, reverse=True)
+    if upcoming:
+        next_talk = upcoming[0]
+    elif timeline.talks:
+        next_talk = timeline.talks[0]
+    else:
+        next_talk = talks[0] if talks else None
 
-    next_talk = upcoming[0] if upcoming else (sorted(talks, key=future_key)[0] if talks else None)
-
-    delivered = len(past)
-    speaker_names = {name for talk in upcoming for name in talk.speakers if name}
-    tag_counts: Dict[str, int] = {}
-    for talk in talks:
-        for bucket in (talk.tags or []):
-            tag_counts[bucket] = tag_counts.get(bucket, 0) + 1
-        for topic in talk.topics or []:
-            tag_counts[topic] = tag_counts.get(topic, 0) + 1
-    top_tag = max(tag_counts, key=tag_counts.get) if tag_counts else "N/A"
+    aggregates: TalkStats = aggregate_stats(talks, now)
 
     return {
         "talks": talks,
+        "archive_pages": archive_pages,
+        "timeline": timeline,
+        "now": now,
         "upcoming": upcoming,
         "past": past,
         "next_talk": next_talk,
         "recent": past[:6],
+        "aggregates": aggregates,
         "stats": {
-            "delivered": delivered,
-            "upcoming_speakers": len(speaker_names),
-            "top_tag": top_tag,
+            "delivered": aggregates.delivered,
+            "upcoming_speakers": aggregates.upcoming_speakers,
+            "top_tag": aggregates.top_tag,
         },
     }
 
 
-def get_schedule_data() -> Dict[str, Any]:
-    return _build()
+def get_schedule_data(roots: SiteRoots = DEFAULT_ROOTS) -> Dict[str, Any]:
+    return _build(roots)
+
 
+def _parse_instant(raw: Any) -> datetime:
+    if isinstance(raw, datetime):
+        return raw if raw.tzinfo else raw.replace(tzinfo=timezone.utc)
+    parsed = _mk_dt(str(raw)[:10], str(raw)[11:16] or None, "UTC")
+    if parsed is None:
+        raise ValueError(f"Cannot parse date {raw!r}; expected YYYY-MM-DD[ HH:MM]")
+    return parsed
 
-def get_talk_by_slug(slug: str) -> Optional[Talk]:
-    for talk in _build()["talks"]:
+
+def talks_between(start: Any, end: Any, roots: SiteRoots = DEFAULT_ROOTS) -> List[Talk]:
+    """Return talks starting in ``[start, end)``; string bounds are read as UTC."""
+    return _build(roots)["timeline"].between(_parse_instant(start), _parse_instant(end))
+
+
+def talks_in_month(year: int, month: int, roots: SiteRoots = DEFAULT_ROOTS) -> List[Talk]:
+    """Return talks whose local start date falls in the given month."""
+    return _build(roots)["timeline"].in_month(int(year), int(month))
+
+
+def _relative_link(link: str, page_src: Optional[str]) -> str:
+    if not page_src or "://" in link:
+        return link
+    return posixpath.relpath(link, posixpath.dirname(page_src) or ".")
+
+
+def render_talk_list(talks: List[Talk], page_src: Optional[str] = None) -> str:
+    """Render a Markdown bullet list of talks with links relative to ``page_src``."""
+    if not talks:
+        return "No talks in this period."
+    lines: List[str] = []
+    for talk in talks:
+        heading = f"{_format_date(talk)} — {talk.title}"
+        if talk.link:
+            lines.append(f"- **[{heading}]({_relative_link(talk.link, page_src)})**")
+        else:
+            lines.append(f"- **{heading}**")
+        if talk.speakers:
+            lines.append("  - Speakers: " + ", ".join(talk.speakers))
+    return "\n".join(lines)
+
+
+def get_talk_by_slug(slug: str, roots: SiteRoots = DEFAULT_ROOTS) -> Optional[Talk]:
+    for talk in _build(roots)["talks"]:
         if talk.slug == slug:
             return talk
     return None
 
 
 def define_env(env):
+    roots = roots_from_config(env.conf)
+
     @env.macro
     def dashboard_next_talk():
-        data = _build()
+        data = _build(roots)
         talk = data.get("next_talk")
         if not talk:
             return '<div class="admonition info"><p>No upcoming talk is scheduled.</p></div>'
@@ -386,7 +666,7 @@ def define_env(env):
 
     @env.macro
     def dashboard_quick_stats():
-        stats = _build()["stats"]
+        stats = _build(roots)["stats"]
         return f"""
 <section class="dashboard quick-stats">
   <div class="stats-grid">
@@ -395,11 +675,61 @@ def define_env(env):
     <div class="stat"><div class="num">{stats['top_tag']}</div><div class="label">Top topic</div></div>
   </div>
 </section>
+"""
+
+    @env.macro
+    def dashboard_top_tags(count: int = 5):
+        ranked = _build(roots)["aggregates"].top_tags(int(count))
+        if not ranked:
+            return ""
+        rows = "".join(
+            f'<li><span class="label">{name}</span> <span class="num">{total}</span></li>' for name, total in ranked
+        )
+        return f"""
+<section class="dashboard top-tags">
+  <div class="section-title"><h2>Top Topics</h2></div>
+  <ol class="leaderboard">{rows}</ol>
+</section>
+"""
+
+    @env.macro
+    def dashboard_speaker_leaderboard(count: int = 5):
+        ranked = _build(roots)["aggregates"].top_speakers(int(count))
+        if not ranked:
+            return ""
+        rows = "".join(
+            f'<li><span class="label">{name}</span> <span class="num">{total}</span></li>' for name, total in ranked
+        )
+        return f"""
+<section class="dashboard speaker-leaderboard">
+  <div class="section-title"><h2>Most Frequent Speakers</h2></div>
+  <ol class="leaderboard">{rows}</ol>
+</section>
+"""
+
+    @env.macro
+    def dashboard_yearly_histogram():
+        aggregates = _build(roots)["aggregates"]
+        histogram = aggregates.yearly_histogram()
+        if not histogram:
+            return ""
+        peak = max(total for _, total in histogram) or 1
+        bars = "".join(
+            f'<div class="bar" style="--share: {total / peak:.3f}" title="{year}: {total}">'
+            f'<span class="num">{total}</span><span class="label">{year}</span></div>'
+            for year, total in histogram
+        )
+        return f"""
+<section class="dashboard yearly-histogram">
+  <div class="section-title"><h2>Talks per Year</h2></div>
+  <div class="histogram">{bars}</div>
+  <p class="muted">{aggregates.recorded_hours} hours of recorded sessions.</p>
+</section>
 """
 
     @env.macro
     def dashboard_recent_talks(count: int = 4):
-        recent = _build()["recent"][: int(count)]
+        recent = _build(roots)["recent"][: int(count)]
         if not recent:
             return ""
         cards: List[str] = []
@@ -431,7 +761,7 @@ def define_env(env):
 
     @env.macro
     def generate_schedule():
-        data = _build()
+        data = _build(roots)
         upcoming = data["upcoming"]
         past = data["past"]
         lines: List[str] = ["# Upcoming Sessions", ""]
@@ -472,7 +802,7 @@ def define_env(env):
 
     @env.macro
     def generate_past_index():
-        data = _build()
+        data = _build(roots)
         past = data["past"]
         lines: List[str] = ["# Past Talks", ""]
         if not past:
@@ -502,4 +832,31 @@ def define_env(env):
                     lines.append("  - " + " | ".join(details))
         return "\n".join(lines)
 
+    def _page_src() -> Optional[str]:
+        page = getattr(env, "page", None)
+        return page.file.src_path if page is not None else None
+
+    def talks_between_macro(start, end):
+        return render_talk_list(talks_between(start, end, roots), _page_src())
+
+    def talks_in_month_macro(year: int, month: int):
+        return render_talk_list(talks_in_month(year, month, roots), _page_src())
+
+    env.macro(talks_between_macro, "talks_between")
+    env.macro(talks_in_month_macro, "talks_in_month")
+
+    @env.macro
+    def talk_provenance(slug: str):
+        talk = get_talk_by_slug(slug, roots)
+        if not talk:
+            return f'<div class="admonition warning"><p>No talk found for slug <code>{slug}</code>.</p></div>'
+        lines: List[str] = ["| Field | Value | Source |", "| --- | --- | --- |"]
+        for name in ("slug",) + _OVERLAY_FIELDS:
+            value = getattr(talk, name)
+            if value in (None, [], {}, ""):
+                continue
+            shown = str(value).replace("\n", " ").replace("|", "\\|")
+            lines.append(f"| `{name}` | {shown} | `{talk.provenance(name)}` |")
+        return "\n".join(lines)
+
     return env
@@ -0,0 +1,51 @@
+"""Compare two site manifests to decide whether (and what) to deploy.
+
+Usage: python site_diff.py OLD_MANIFEST NEW_MANIFEST [--upload-list FILE] [--removed-list FILE]
+
+Exits 0 when both builds are identical (deploy can be skipped) and 1 when
+anything was added, changed or removed. The optional lists are written one
+path per line, relative to ``site/``, for ``rsync --files-from`` and friends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import List
+
+from lib.site_manifest import diff_manifests, load_manifest
+
+
+def _write_list(path: Path, entries: List[str]) -> None:
+    path.write_text("".join(f"{entry}\n" for entry in entries), encoding="utf-8")
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("old", type=Path, help="manifest of the currently deployed site (may be missing)")
+    parser.add_argument("new", type=Path, help="manifest of the fresh build")
+    parser.add_argument("--upload-list", type=Path, help="write added and changed paths here")
+    parser.add_argument("--removed-list", type=Path, help="write removed paths here")
+    args = parser.parse_args(argv)
+
+    try:
+        diff = diff_manifests(load_manifest(args.old), load_manifest(args.new))
+    except ValueError as exc:
+        print(f"Could not read manifest: {exc}", file=sys.stderr)
+        return 2
+
+    if args.upload_list:
+        _write_list(args.upload_list, diff.upload)
+    if args.removed_list:
+        _write_list(args.removed_list, diff.removed)
+
+    if diff.unchanged:
+        print("Site unchanged; nothing to deploy.")
+        return 0
+    print(f"{len(diff.added)} added, {len(diff.changed)} changed, {len(diff.removed)} removed.")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
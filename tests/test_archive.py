@@ -0,0 +1,92 @@
+import json
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import macros
+from lib.archive import archived_page_source, freeze_archive, prune_schedule
+
+SCHEDULE = """\
+upcoming:
+- title: Fresh Talk
+  slug: fresh
+  date: 2099-01-01
+past:
+- title: Old Talk
+  slug: old
+  date: 2015-03-01
+  tags: [History]
+"""
+
+
+class ArchiveTest(unittest.TestCase):
+    """Checks for freezing old talks into the archive snapshot."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        (root / "docs" / "talks").mkdir(parents=True)
+        schedule = root / "data" / "schedule.yml"
+        schedule.parent.mkdir()
+        schedule.write_text(SCHEDULE, encoding="utf-8")
+        self.roots = macros.SiteRoots(root, root / "docs", (schedule,))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_freeze_then_build_reads_archive(self) -> None:
+        talks = macros.get_schedule_data(self.roots)["talks"]
+        cutoff = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        self.assertEqual(freeze_archive(talks, cutoff, self.roots.archive_path), ["old"])
+        self.assertEqual(freeze_archive(talks, cutoff, self.roots.archive_path), [])
+
+        data = macros.get_schedule_data(self.roots)
+        old = next(talk for talk in data["talks"] if talk.slug == "old")
+        self.assertEqual(old.source, "data/archive.json")
+        self.assertEqual(old.tags, ["History"])
+        self.assertIsNotNone(old.dt)
+        self.assertEqual(len(data["talks"]), 2)
+
+        source = archived_page_source(data["archive_pages"]["old"])
+        self.assertTrue(source.startswith("---\ntitle: Old Talk"))
+        self.assertIn('<div class="archived-talk">', source)
+        self.assertIn("<h1", source)
+
+    def test_future_cutoff_keeps_upcoming_talks_out(self) -> None:
+        talks = macros.get_schedule_data(self.roots)["talks"]
+        cutoff = datetime(2100, 1, 1, tzinfo=timezone.utc)
+        self.assertEqual(freeze_archive(talks, cutoff, self.roots.archive_path), ["old"])
+
+    def test_edits_to_archived_schedule_entries_are_reported(self) -> None:
+        talks = macros.get_schedule_data(self.roots)["talks"]
+        freeze_archive(talks, datetime(2020, 1, 1, tzinfo=timezone.utc), self.roots.archive_path)
+        schedule = self.roots.schedule_paths[0]
+        schedule.write_text(SCHEDULE + "  recording_url: https://example.com/old\n", encoding="utf-8")
+
+        with self.assertLogs("mkdocs.macros", "WARNING") as logs:
+            data = macros.get_schedule_data(self.roots)
+        self.assertIn("'old' differs from data/schedule.yml:6 in recording_url", logs.output[0])
+        old = next(talk for talk in data["talks"] if talk.slug == "old")
+        self.assertIsNone(old.recording_url)
+
+    def test_malformed_archive_records_are_skipped(self) -> None:
+        self.roots.archive_path.write_text(
+            json.dumps({"talks": [{"title": "No slug"}, "junk", {"slug": "ok", "title": "Kept"}]}),
+            encoding="utf-8",
+        )
+        with self.assertLogs("mkdocs.macros", "WARNING") as logs:
+            archived, pages = macros._read_archive(self.roots)
+        self.assertEqual([talk.slug for talk in archived], ["ok"])
+        self.assertEqual(list(pages), ["ok"])
+        self.assertEqual(len(logs.output), 2)
+
+    def test_prune_schedule_drops_archived_entries(self) -> None:
+        data = {"upcoming": [{"slug": "fresh"}], "past": [{"slug": "old"}], "stats": {"total_talks": 2}}
+        self.assertEqual(prune_schedule(data, ["old"]), 1)
+        self.assertEqual(data["past"], [])
+        self.assertEqual(data["upcoming"], [{"slug": "fresh"}])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,75 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from lib.asset_bundle import MANIFEST_NAME, bundle_site_assets, minify_css, minify_js
+
+
+class AssetBundleTest(unittest.TestCase):
+    """Regression checks for the post-build asset bundler."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.site_dir = Path(self.tmp.name)
+        assets = self.site_dir / "assets"
+        assets.mkdir()
+        (assets / "site.css").write_text("/* c */\n.a {\n  color: red;\n}\n", encoding="utf-8")
+        (assets / "one.js").write_text("// one\nconst a = 1;\n", encoding="utf-8")
+        (assets / "two.js").write_text("const b = `x\n  y`;\n", encoding="utf-8")
+        page = self.site_dir / "talks" / "index.html"
+        page.parent.mkdir()
+        page.write_text(
+            '<link rel="stylesheet" href="../assets/site.css">\n'
+            '<script src="../assets/one.js"></script>\n'
+            '<script src="../assets/two.js"></script>\n',
+            encoding="utf-8",
+        )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_minifiers(self) -> None:
+        self.assertEqual(minify_css("/* x */ .a , .b {\n  margin: 0 ;\n}"), ".a,.b{margin:0}")
+        self.assertEqual(minify_js("  // c\n  let t = `a\n    b`;\n\n"), "let t = `a\n    b`;\n")
+
+    def test_bundle_rewrites_references_and_writes_manifest(self) -> None:
+        manifest = bundle_site_assets(self.site_dir, ["assets/site.css"], ["assets/one.js", "assets/two.js"])
+
+        css_target = manifest["assets/site.css"]
+        js_target = manifest["assets/one.js"]
+        self.assertRegex(css_target, r"^assets/site\.[0-9a-f]{8}\.css$")
+        self.assertRegex(js_target, r"^assets/bundle\.[0-9a-f]{8}\.js$")
+        self.assertEqual(manifest["assets/two.js"], js_target)
+        self.assertTrue((self.site_dir / js_target).exists())
+
+        html = (self.site_dir / "talks" / "index.html").read_text(encoding="utf-8")
+        self.assertIn(f'href="../{css_target}"', html)
+        self.assertEqual(html.count("<script"), 1)
+        self.assertIn(f'src="../{js_target}"', html)
+
+        on_disk = json.loads((self.site_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        self.assertEqual(on_disk, manifest)
+
+    def test_bundle_rewrites_absolute_references_under_site_url(self) -> None:
+        page = self.site_dir / "404.html"
+        page.write_text(
+            '<link rel="stylesheet" href="/docs-site/assets/site.css">\n'
+            '<script src="/docs-site/assets/one.js"></script>\n'
+            '<script src="/docs-site/assets/two.js"></script>\n'
+            '<script src="/elsewhere/assets/one.js"></script>\n',
+            encoding="utf-8",
+        )
+        manifest = bundle_site_assets(
+            self.site_dir, ["assets/site.css"], ["assets/one.js", "assets/two.js"], "https://example.org/docs-site/"
+        )
+
+        html = page.read_text(encoding="utf-8")
+        self.assertIn(f'href="/docs-site/{manifest["assets/site.css"]}"', html)
+        self.assertIn(f'src="/docs-site/{manifest["assets/one.js"]}"', html)
+        self.assertNotIn("/docs-site/assets/two.js", html)
+        self.assertIn('src="/elsewhere/assets/one.js"', html)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
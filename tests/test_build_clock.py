@@ -0,0 +1,24 @@
+import importlib.util
+import unittest
+from datetime import datetime, timezone
+
+import macros
+
+
+class BuildClockTest(unittest.TestCase):
+    """Checks that every copy of ``macros`` reads the same frozen clock."""
+
+    def test_plugin_copy_of_macros_shares_the_clock(self) -> None:
+        # mkdocs-macros loads macros.py like this, separately from ``import macros``.
+        spec = importlib.util.spec_from_file_location("macros", macros.__file__)
+        plugin_copy = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(plugin_copy)
+        self.addCleanup(macros.freeze_build_clock)
+
+        frozen = macros.freeze_build_clock(datetime(2030, 1, 1, tzinfo=timezone.utc))
+        self.assertIsNot(plugin_copy, macros)
+        self.assertEqual(plugin_copy.build_clock(), frozen)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from mkdocs.utils import meta
+
+import macros
+from lib.front_matter import FRONT_MATTER, split_front_matter
+from lib.generated_talks import build_talk_markdown, write_generated_markdown
+
+
+class FrontMatterStoreTest(unittest.TestCase):
+    """Checks that talk front matter is parsed once and agrees with MkDocs."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "docs" / "talks").mkdir(parents=True)
+        self.roots = macros.SiteRoots(self.root, self.root / "docs", (self.root / "schedule.yml",))
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_split_matches_mkdocs(self) -> None:
+        samples = [
+            "---\ntitle: Hello\ntags: [a, b]\n---\n\n# Hello\n",
+            "---\ntitle: Dots\n...\nBody\n",
+            "---\n- not a mapping\n---\nBody\n",
+            "---\ntitle: [unclosed\n---\nBody\n",
+            "# No front matter\n",
+        ]
+        for text in samples:
+            with self.subTest(text=text):
+                markdown, data = meta.get_data(text)
+                entry = split_front_matter(text)
+                self.assertEqual(entry.meta, data)
+                self.assertEqual(entry.body, markdown)
+
+    def test_talk_pages_parse_once_and_accept_bom(self) -> None:
+        page = self.roots.docs / "talks" / "bom-talk.md"
+        page.write_text("\ufeff---\ntitle: BOM Talk\ndate: 2025-11-04\n---\n\n# BOM Talk\n", encoding="utf-8")
+
+        before = FRONT_MATTER.parses
+        talks = macros._read_talk_pages(self.roots)
+        entry = FRONT_MATTER.get(page)
+
+        self.assertEqual([talk.title for talk in talks], ["BOM Talk"])
+        self.assertEqual(FRONT_MATTER.parses - before, 1)
+        self.assertEqual(entry.body, "# BOM Talk\n")
+
+    def test_generated_pages_are_stored_without_parsing(self) -> None:
+        talk = macros.Talk(title="Stored Talk", slug="stored-talk", date="2025-01-01", tags=["sql"])
+        before = FRONT_MATTER.parses
+        path = write_generated_markdown(talk, self.root / "_generated")
+        entry = FRONT_MATTER.get(path)
+
+        self.assertEqual(FRONT_MATTER.parses, before)
+        self.assertEqual(split_front_matter(build_talk_markdown(talk)), entry)
@@ -9,7 +9,6 @@ from lib.generated_talks import (
     GENERATED_DIR_NAME,
     generate_missing_talk_pages,
     read_generated_source,
-    reset_generated_root,
 )
 
 
@@ -26,7 +25,6 @@ class GeneratedTalksTest(unittest.TestCase):
         self.tmp.cleanup()
 
     def test_generate_markdown_for_missing_talk(self) -> None:
-        reset_generated_root(self.docs_dir, GENERATED_DIR_NAME)
         files = Files([])
 
         talk = macros.Talk(
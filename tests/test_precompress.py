@@ -0,0 +1,60 @@
+import gzip
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from lib.precompress import CACHE_MAX_AGE, precompress_site
+
+
+class PrecompressTest(unittest.TestCase):
+    """Regression checks for the post-build precompression stage."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.site_dir = root / "site"
+        self.cache_dir = root / "cache"
+        self.site_dir.mkdir()
+        self.page = self.site_dir / "index.html"
+        self.page.write_text("<p>hello</p>\n" * 100, encoding="utf-8")
+        (self.site_dir / "tiny.css").write_text("a{}", encoding="utf-8")
+        (self.site_dir / "logo.png").write_bytes(b"\x89PNG" * 200)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_writes_siblings_and_reuses_cache(self) -> None:
+        first = precompress_site(self.site_dir, self.cache_dir, workers=1)
+        self.assertEqual((first.files, first.compressed, first.reused), (1, 1, 0))
+        self.assertGreater(first.saved_bytes, 0)
+
+        sibling = self.site_dir / "index.html.gz"
+        self.assertEqual(gzip.decompress(sibling.read_bytes()), self.page.read_bytes())
+        self.assertFalse((self.site_dir / "tiny.css.gz").exists())
+        self.assertFalse((self.site_dir / "logo.png.gz").exists())
+
+        sibling.unlink()
+        second = precompress_site(self.site_dir, self.cache_dir, workers=1)
+        self.assertEqual((second.compressed, second.reused), (0, 1))
+        self.assertTrue(sibling.exists())
+
+    def test_prunes_cache_entries_unused_for_too_long(self) -> None:
+        precompress_site(self.site_dir, self.cache_dir, workers=1)
+        stale = self.cache_dir / ("0" * 64 + ".gz")
+        stale.write_bytes(b"old")
+        old = time.time() - CACHE_MAX_AGE - 60
+        os.utime(stale, (old, old))
+        for entry in self.cache_dir.iterdir():
+            if entry != stale:
+                os.utime(entry, (old, old))
+
+        report = precompress_site(self.site_dir, self.cache_dir, workers=1)
+        self.assertEqual((report.reused, report.pruned), (1, 1))
+        self.assertFalse(stale.exists())
+        self.assertTrue(any(self.cache_dir.iterdir()))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
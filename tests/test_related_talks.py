@@ -0,0 +1,114 @@
+import os
+import random
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+import macros
+from lib import related_talks
+from lib.precompress import CACHE_MAX_AGE
+from lib.related_talks import compute_related, render_related_section
+
+
+class RelatedTalksTest(unittest.TestCase):
+    """Checks for the related-talks precomputation."""
+
+    def setUp(self) -> None:
+        self.talks = [
+            macros.Talk(title="Postgres Indexes", slug="pg-indexes", tags=["SQL"], abstract="B-tree index tuning"),
+            macros.Talk(title="Query Plans", slug="query-plans", tags=["SQL"], abstract="Reading index scans"),
+            macros.Talk(title="Kubernetes Basics", slug="k8s", tags=["Ops"], abstract="Pods and deployments"),
+            macros.Talk(title="Helm Charts", slug="helm", tags=["Ops"], abstract="Packaging deployments"),
+        ]
+        related_talks._MEMO.clear()
+
+    def test_neighbours_share_tags_and_terms(self) -> None:
+        related = compute_related(self.talks, k=1)
+        self.assertEqual([slug for slug, _ in related["pg-indexes"]], ["query-plans"])
+        self.assertEqual([slug for slug, _ in related["k8s"]], ["helm"])
+
+    def test_results_are_cached_on_disk_by_snapshot_hash(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            first = compute_related(self.talks, cache_dir, k=2)
+            self.assertEqual(len(list(cache_dir.glob("*.json"))), 1)
+            related_talks._MEMO.clear()
+            self.assertEqual(compute_related(self.talks, cache_dir, k=2), first)
+
+    def test_unused_cache_files_are_pruned(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            stale = cache_dir / "0123abcd-k3.json"
+            stale.write_text("{}", encoding="utf-8")
+            old = time.time() - CACHE_MAX_AGE - 60
+            os.utime(stale, (old, old))
+
+            compute_related(self.talks, cache_dir, k=2)
+            (current,) = cache_dir.glob("*.json")
+            os.utime(current, (old, old))
+            related_talks._MEMO.clear()
+            compute_related(self.talks, cache_dir, k=2)
+
+            self.assertFalse(stale.exists())
+            self.assertEqual(list(cache_dir.glob("*.json")), [current])
+
+    def test_render_links_relative_to_page(self) -> None:
+        talk = macros._decorate(self.talks[1])
+        section = render_related_section([talk], "talks/previous/old.md")
+        self.assertIn("## Related talks", section)
+        self.assertIn("(../query-plans.md)", section)
+
+    def test_sparse_product_matches_brute_force_cosine(self) -> None:
+        talks = self._corpus(60)
+        vectors = related_talks.build_vectors(talks)
+        expected = []
+        for row, vector in enumerate(vectors):
+            scores = [
+                (other, round(sum(weight * candidate.get(feature, 0.0) for feature, weight in vector.items()), 6))
+                for other, candidate in enumerate(vectors)
+                if other != row
+            ]
+            ranked = sorted((pair for pair in scores if pair[1] > 0), key=lambda pair: (-pair[1], pair[0]))
+            expected.append(ranked[:3])
+        self.assertEqual(related_talks.top_k_neighbours(vectors, 3), expected)
+
+    def test_label_shared_by_every_talk_matches_dense_product(self) -> None:
+        # Every talk carries the "All" tag, the worst case for an inverted index;
+        # the corpus spans several BLOCK_ROWS blocks of the sparse product.
+        talks = self._corpus(related_talks.BLOCK_ROWS * 2 + 100)
+        vectors = related_talks.build_vectors(talks)
+        dense = related_talks.to_matrix(vectors).toarray()
+        scores = np.round(dense @ dense.T, 6)
+        expected = []
+        for row in range(len(talks)):
+            ranked = sorted(
+                ((other, float(score)) for other, score in enumerate(scores[row]) if other != row and score > 0),
+                key=lambda pair: (-pair[1], pair[0]),
+            )
+            expected.append(ranked[:3])
+
+        neighbours = related_talks.top_k_neighbours(vectors, 3)
+        self.assertEqual(neighbours, expected)
+        self.assertTrue(all(len(pairs) == 3 for pairs in neighbours))
+
+    @staticmethod
+    def _corpus(count: int):
+        rng = random.Random(7)
+        vocabulary = [f"term{index}" for index in range(3000)]
+        return [
+            macros.Talk(
+                title=" ".join(rng.sample(vocabulary, 4)),
+                slug=f"talk-{index}",
+                tags=["All", f"tag{rng.randrange(25)}"],
+                speakers=[f"Speaker {rng.randrange(300)}"],
+                abstract=" ".join(rng.choices(vocabulary, k=40)),
+            )
+            for index in range(count)
+        ]
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
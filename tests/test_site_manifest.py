@@ -0,0 +1,37 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from lib.site_manifest import MANIFEST_NAME, diff_manifests, load_manifest, write_manifest
+
+
+class SiteManifestTest(unittest.TestCase):
+    """Checks for the site manifest and delta computation."""
+
+    def test_manifest_round_trip_and_diff(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            site_dir = Path(tmpdir)
+            (site_dir / "index.html").write_text("home", encoding="utf-8")
+            (site_dir / "talks").mkdir()
+            (site_dir / "talks" / "index.html").write_text("talks", encoding="utf-8")
+            old = write_manifest(site_dir)
+            self.assertEqual(sorted(old), ["index.html", "talks/index.html"])
+            self.assertEqual(load_manifest(site_dir / MANIFEST_NAME), old)
+
+            (site_dir / "index.html").write_text("home v2", encoding="utf-8")
+            (site_dir / "talks" / "index.html").unlink()
+            (site_dir / "feed.xml").write_text("<feed/>", encoding="utf-8")
+            diff = diff_manifests(old, write_manifest(site_dir))
+
+        self.assertEqual(diff.added, ["feed.xml"])
+        self.assertEqual(diff.changed, ["index.html"])
+        self.assertEqual(diff.removed, ["talks/index.html"])
+        self.assertEqual(diff.upload, ["feed.xml", "index.html"])
+        self.assertTrue(diff_manifests(old, dict(old)).unchanged)
+
+    def test_missing_manifest_is_empty(self) -> None:
+        self.assertEqual(load_manifest(Path("does-not-exist.json")), {})
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,89 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from mkdocs.commands.build import build
+from mkdocs.config import load_config
+
+import macros
+from lib.parse_cache import PARSE_CACHE, SNAPSHOTS
+
+ROOT = Path(macros.__file__).resolve().parent
+
+
+class SiteRootsTest(unittest.TestCase):
+    """Checks that tenant roots are injected rather than read from module constants."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        for name in ("alpha", "beta"):
+            (self.root / name / "docs" / "talks").mkdir(parents=True)
+            (self.root / name / "schedule.yml").write_text(
+                f"upcoming:\n- title: {name.title()} Talk\n  slug: {name}-talk\n  date: 2099-01-01\n",
+                encoding="utf-8",
+            )
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def _roots(self, name: str) -> macros.SiteRoots:
+        config = {
+            "config_file_path": str(self.root / "mkdocs.yml"),
+            "docs_dir": str(self.root / name / "docs"),
+            "extra": {"schedule": f"{name}/schedule.yml"},
+        }
+        return macros.roots_from_config(config)
+
+    def test_each_tenant_builds_from_its_own_schedule(self) -> None:
+        alpha = macros.get_schedule_data(self._roots("alpha"))
+        beta = macros.get_schedule_data(self._roots("beta"))
+        self.assertEqual([talk.title for talk in alpha["talks"]], ["Alpha Talk"])
+        self.assertEqual([talk.title for talk in beta["talks"]], ["Beta Talk"])
+        self.assertEqual(alpha["talks"][0].source, "alpha/schedule.yml")
+
+    def test_parse_cache_is_shared_between_builds(self) -> None:
+        roots = self._roots("alpha")
+        macros.get_schedule_data(roots)
+        path = roots.schedule_paths[0]
+        cached = PARSE_CACHE.peek("yaml", path)
+        SNAPSHOTS.clear()
+        macros.get_schedule_data(roots)
+        self.assertIs(PARSE_CACHE.peek("yaml", path), cached)
+        self.assertIn(("validated", path), PARSE_CACHE)
+
+    def test_rebuilding_a_tenant_through_mkdocs_parses_nothing(self) -> None:
+        # mkdocs-macros re-executes macros.py on every build, so this only
+        # passes if the caches live outside that module.
+        for name in ("alpha", "beta"):
+            (self.root / name / "docs" / "index.md").write_text("{{ dashboard_quick_stats() }}\n", encoding="utf-8")
+            (self.root / f"{name}.yml").write_text(
+                "\n".join(
+                    [
+                        f"site_name: {name}",
+                        f"docs_dir: {name}/docs",
+                        f"site_dir: {name}/site",
+                        "theme: {name: mkdocs}",
+                        "plugins:",
+                        f"- macros: {{module_name: {ROOT / 'macros'}}}",
+                        f"hooks: [{ROOT / 'hooks.py'}]",
+                        f"extra: {{schedule: {name}/schedule.yml}}",
+                        "",
+                    ]
+                ),
+                encoding="utf-8",
+            )
+
+        def yaml_parses(name: str) -> int:
+            before = PARSE_CACHE.parses["yaml"]
+            build(load_config(str(self.root / f"{name}.yml")))
+            return PARSE_CACHE.parses["yaml"] - before
+
+        self.assertEqual(yaml_parses("alpha"), 1)
+        self.assertEqual(yaml_parses("beta"), 1)
+        self.assertEqual(yaml_parses("alpha"), 0)
+        self.assertIn("Alpha Talk", (self.root / "alpha" / "site" / "talks" / "alpha-talk" / "index.html").read_text())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,122 @@
+import gzip
+import os
+import subprocess
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import macros
+from lib.content_dates import git_commit_dates
+from lib.content_history import ContentHistory, history_path
+from lib.syndication import ATOM_NS, FeedEntry, publish_feeds, write_atom_feed, write_sitemap
+
+
+class SyndicationTest(unittest.TestCase):
+    """Checks for the streaming feed/sitemap writers and content history."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_atom_feed_is_well_formed(self) -> None:
+        entry = FeedEntry(
+            title="Q&A <live>",
+            url="https://example.com/talks/qa/",
+            published=self.now,
+            updated=self.now,
+            authors=["Ada"],
+            categories=["SQL"],
+        )
+        path = self.root / "feeds" / "talks.atom.xml"
+        count = write_atom_feed(path, "Talks", "https://example.com/feeds/talks.atom.xml", "https://example.com/", iter([entry]), self.now)
+
+        self.assertEqual(count, 1)
+        tree = ET.parse(path)
+        entries = tree.getroot().findall(f"{{{ATOM_NS}}}entry")
+        self.assertEqual(entries[0].findtext(f"{{{ATOM_NS}}}title"), "Q&A <live>")
+
+    def test_colliding_tags_get_separate_feeds(self) -> None:
+        talks = [
+            macros.Talk(title=tag, slug=tag.lower(), link=f"talks/{index}.md", tags=[tag])
+            for index, tag in enumerate(["C++", "C#", "SQL", "sql"])
+        ]
+        page_index = {talk.link: (f"https://example.com/{talk.link}", "h") for talk in talks}
+        history = ContentHistory(self.root / "history.json")
+        written = publish_feeds(self.root, "https://example.com/", "Talks", talks, page_index, history, self.now)
+
+        tag_feeds = sorted(name for name in written if name.startswith("tags/"))
+        self.assertEqual(len(tag_feeds), 4)
+        self.assertIn("tags/c-plus-plus.atom.xml", tag_feeds)
+        self.assertIn("tags/c-sharp.atom.xml", tag_feeds)
+        self.assertEqual(sorted(path.relative_to(self.root / "feeds").as_posix() for path in (self.root / "feeds" / "tags").iterdir()), tag_feeds)
+
+    def test_sitemap_and_gzip_copy(self) -> None:
+        path = self.root / "sitemap.xml"
+        write_sitemap(path, [("https://example.com/", "2025-01-01")])
+        self.assertEqual(gzip.decompress((self.root / "sitemap.xml.gz").read_bytes()), path.read_bytes())
+        self.assertIn(b"<lastmod>2025-01-01</lastmod>", path.read_bytes())
+
+    def test_history_lastmod_moves_only_on_change(self) -> None:
+        path = self.root / "history.json"
+        history = ContentHistory(path)
+        history.touch("page:a.md", "h1", self.now)
+        history.save()
+
+        later = self.now + timedelta(days=3)
+        reloaded = ContentHistory(path)
+        self.assertEqual(reloaded.touch("page:a.md", "h1", later)["lastmod"], self.now.isoformat())
+        entry = reloaded.touch("page:a.md", "h2", later)
+        self.assertEqual(entry["lastmod"], later.isoformat())
+        self.assertEqual(entry["first_seen"], self.now.isoformat())
+
+        older = reloaded.touch("page:a.md", "h3", self.now)
+        self.assertEqual(older["lastmod"], later.isoformat())
+
+    def test_git_commit_dates_ignore_uncommitted_files(self) -> None:
+        def git(*args: str, epoch: int = 0) -> None:
+            stamp = f"@{epoch} +0000"
+            env = dict(os.environ, GIT_AUTHOR_DATE=stamp, GIT_COMMITTER_DATE=stamp)
+            subprocess.run(["git", "-C", str(self.root), *args], check=True, capture_output=True, env=env)
+
+        docs = self.root / "docs"
+        docs.mkdir()
+        git("init", "-q")
+        git("config", "user.email", "dev@example.com")
+        git("config", "user.name", "Dev")
+        (docs / "a.md").write_text("a\n", encoding="utf-8")
+        (docs / "b.md").write_text("b\n", encoding="utf-8")
+        git("add", ".")
+        git("commit", "-qm", "first", epoch=1_700_000_000)
+        (docs / "b.md").write_text("b2\n", encoding="utf-8")
+        git("commit", "-qam", "second", epoch=1_700_086_400)
+        (self.root / "README.md").write_text("readme\n", encoding="utf-8")
+        git("add", ".")
+        git("commit", "-qm", "readme", epoch=1_700_172_800)
+        (docs / "a.md").write_text("dirty\n", encoding="utf-8")
+
+        dates = git_commit_dates(self.root, [docs])
+        self.assertEqual(dates, {(docs / "b.md").resolve(): datetime.fromtimestamp(1_700_086_400, timezone.utc)})
+        self.assertEqual(git_commit_dates(self.root / "docs" / "missing", [docs]), {})
+
+    def test_history_is_kept_per_site(self) -> None:
+        cache_dir = self.root / ".cache"
+        main = history_path(cache_dir, self.root, self.root / "site")
+        tenant = history_path(cache_dir, self.root, self.root / "site" / "platform")
+        self.assertEqual(main, cache_dir / "history" / "site.json")
+        self.assertEqual(tenant, cache_dir / "history" / "site-platform.json")
+
+        history = ContentHistory(tenant)
+        history.touch("page:a.md", "h1", self.now)
+        history.save()
+        self.assertEqual([path.name for path in tenant.parent.iterdir()], ["site-platform.json"])
+        self.assertFalse(main.exists())
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import macros
+
+
+class TalkOverlayTest(unittest.TestCase):
+    """Checks for the schedule/page overlay merge."""
+
+    def setUp(self) -> None:
+        self.schedule_talk = macros.Talk(
+            title="Scheduled Title",
+            slug="overlay-talk",
+            date="2025-01-01",
+            tags=["Python"],
+            resources={"slides": "https://example.com/slides.pdf"},
+            source="data/schedule.yml",
+            source_line=4,
+        )
+        self.page_talk = macros.Talk(
+            title="Page Title",
+            slug="overlay-talk",
+            link="talks/overlay-talk.md",
+            source="docs/talks/overlay-talk.md",
+        )
+
+    def test_page_values_win_and_fall_back_to_schedule(self) -> None:
+        merged = macros._merge_schedule_and_pages([self.schedule_talk], [self.page_talk])
+        self.assertEqual(len(merged), 1)
+        talk = merged[0]
+        self.assertIsInstance(talk, macros.TalkOverlay)
+        self.assertEqual(talk.title, "Page Title")
+        self.assertEqual(talk.date, "2025-01-01")
+        self.assertEqual(talk.link, "talks/overlay-talk.md")
+        self.assertIs(talk.tags, self.schedule_talk.tags)
+        self.assertIs(talk.resources, self.schedule_talk.resources)
+
+    def test_provenance_records_the_winning_source(self) -> None:
+        talk = macros._decorate(macros.TalkOverlay(self.page_talk, self.schedule_talk))
+        self.assertEqual(talk.provenance("title"), "docs/talks/overlay-talk.md")
+        self.assertEqual(talk.provenance("tags"), "data/schedule.yml:4")
+        self.assertEqual(talk.provenance("slug"), "data/schedule.yml:4")
+        self.assertEqual(talk.date_str, "2025-01-01")
+
+    def test_schedule_talks_record_their_line(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "schedule.yml"
+            path.write_text(
+                "upcoming:\n- title: First\n  slug: first\n- title: Second\n  slug: second\n",
+                encoding="utf-8",
+            )
+            data, lines = macros._load_yaml_with_lines(path)
+        self.assertEqual([lines[id(item)] for item in data["upcoming"]], [2, 4])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
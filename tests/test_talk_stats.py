@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import macros
+from lib.talk_stats import aggregate_stats
+
+
+class TalkStatsTest(unittest.TestCase):
+    """Checks for the single-pass statistics aggregation."""
+
+    def test_aggregate_stats_single_pass(self) -> None:
+        talks = [
+            macros.Talk(
+                title="Past A",
+                date="2023-03-01",
+                duration=60,
+                speakers=["Ada"],
+                tags=["SQL"],
+                recording_url="https://example.com/a",
+            ),
+            macros.Talk(title="Past B", date="2021-06-01", duration=30, speakers=["Ada", "Bo"], tags=["SQL", "Ops"]),
+            macros.Talk(title="Future", date="2099-01-01", speakers=["Cy"], topics=["Ops"]),
+            macros.Talk(title="Undated", speakers=["Dee"]),
+        ]
+        talks = [macros._decorate(talk) for talk in talks]
+        stats = aggregate_stats(talks, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        self.assertEqual(stats.delivered, 2)
+        self.assertEqual(stats.upcoming_speakers, 1)
+        self.assertEqual(stats.recorded_hours, 1.0)
+        self.assertEqual(stats.top_tags(2), [("SQL", 2), ("Ops", 2)])
+        self.assertEqual(stats.top_speakers(1), [("Ada", 2)])
+        self.assertEqual(stats.tag_trend("SQL"), [(2021, 1), (2023, 1)])
+        histogram = stats.yearly_histogram()
+        self.assertEqual(histogram[:3], [(2021, 1), (2022, 0), (2023, 1)])
+        self.assertEqual(histogram[-1], (2099, 1))
+
+    def test_recorded_minutes_skip_bad_durations(self) -> None:
+        recorded = {"date": "2023-03-01", "recording_url": "https://example.com/r"}
+        talks = [
+            macros.Talk(title="Text", duration="45 min", **recorded),
+            macros.Talk(title="Junk", duration="about an hour", **recorded),
+            macros.Talk(title="Negative", duration=-10, **recorded),
+            macros.Talk(title="Float", duration=15.5, **recorded),
+        ]
+        talks = [macros._decorate(talk) for talk in talks]
+        stats = aggregate_stats(talks, datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+        self.assertEqual(stats.recorded_minutes, 60)
+        self.assertEqual(stats.delivered, 4)
+
+    def test_snapshot_follows_the_build_clock(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "schedule.yml").write_text(
+                "upcoming:\n- title: Boundary\n  slug: boundary\n  date: 2030-06-01\n", encoding="utf-8"
+            )
+            roots = macros.SiteRoots(root, root / "docs", (root / "schedule.yml",))
+            self.addCleanup(macros.freeze_build_clock)
+
+            macros.freeze_build_clock(datetime(2030, 5, 31, tzinfo=timezone.utc))
+            self.assertEqual(macros.get_schedule_data(roots)["stats"]["delivered"], 0)
+            macros.freeze_build_clock(datetime(2030, 6, 2, tzinfo=timezone.utc))
+            self.assertEqual(macros.get_schedule_data(roots)["stats"]["delivered"], 1)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
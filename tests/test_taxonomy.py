@@ -0,0 +1,102 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from mkdocs.structure.files import Files
+
+import macros
+from lib.generated_talks import GENERATED_DIR_NAME, build_talk_page, prune_generated_root
+from lib.taxonomy import assign_slugs, build_taxonomy_pages, generate_taxonomy_pages, group_talks, render_talk_terms
+
+
+class TaxonomyTest(unittest.TestCase):
+    """Checks for the speaker/tag/topic taxonomy pages."""
+
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.docs_dir = Path(self.tmp.name)
+        self.site_dir = self.docs_dir / "site"
+        self.talks = [
+            macros.Talk(
+                title="Newer",
+                slug="newer",
+                link="talks/newer.md",
+                speakers=["Ada Lovelace"],
+                speaker_details=[{"name": "Ada Lovelace", "bio": "Analyst"}],
+                tags=["SQL"],
+                topics=["Indexes"],
+            ),
+            macros.Talk(title="Older", slug="older", link="talks/older.md", speakers=["Ada Lovelace"], tags=["SQL", "Ops"]),
+        ]
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_group_talks_single_pass(self) -> None:
+        taxonomy = group_talks(self.talks)
+        self.assertEqual([talk.slug for talk in taxonomy.groups["speakers"]["Ada Lovelace"]], ["newer", "older"])
+        self.assertEqual(sorted(taxonomy.groups["tags"]), ["Ops", "SQL"])
+        self.assertEqual(taxonomy.speaker_details["Ada Lovelace"], {"bio": "Analyst"})
+
+        pages = build_taxonomy_pages(taxonomy)
+        self.assertIn("speakers/ada-lovelace.md", pages)
+        self.assertIn("Analyst", pages["speakers/ada-lovelace.md"])
+        self.assertIn("(../talks/newer.md)", pages["tags/sql.md"])
+        self.assertIn("- [SQL](sql.md) (2 talks)", pages["tags/index.md"])
+
+    def test_unchanged_pages_are_not_rewritten(self) -> None:
+        files = Files([])
+        generated, written = generate_taxonomy_pages(group_talks(self.talks), self.docs_dir, self.site_dir, files, True)
+        self.assertEqual(written, len(generated))
+        self.assertIsNotNone(files.get_file_from_path("topics/indexes.md"))
+
+        _, rewritten = generate_taxonomy_pages(group_talks(self.talks), self.docs_dir, self.site_dir, Files([]), True)
+        self.assertEqual(rewritten, 0)
+
+        removed = prune_generated_root(self.docs_dir, set(generated) - {"tags/ops.md"}, GENERATED_DIR_NAME)
+        self.assertEqual(removed, 1)
+        self.assertFalse((self.docs_dir / GENERATED_DIR_NAME / "tags" / "ops.md").exists())
+
+    def test_colliding_labels_get_distinct_pages(self) -> None:
+        talks = [macros.Talk(title=name, slug=name.lower(), link=f"talks/{name}.md", tags=[name]) for name in ("C++", "C#", "C")]
+        talks.append(macros.Talk(title="Lower", slug="lower", link="talks/lower.md", tags=["c"]))
+        taxonomy = group_talks(talks)
+        paths = {label: taxonomy.src_path("tags", label) for label in ("C++", "C#", "C", "c")}
+
+        self.assertEqual(paths["C++"], "tags/c-plus-plus.md")
+        self.assertEqual(paths["C#"], "tags/c-sharp.md")
+        self.assertEqual(len(set(paths.values())), 4)
+        pages = build_taxonomy_pages(taxonomy)
+        self.assertEqual(len(pages), 3 + 4)
+        index = pages["tags/index.md"]
+        for label, path in paths.items():
+            self.assertIn(f"- [{label}]({Path(path).name})", index)
+        self.assertEqual(assign_slugs(["c", "C"]), {label: paths[label][len("tags/") : -3] for label in ("c", "C")})
+
+    def test_index_label_does_not_replace_the_index_page(self) -> None:
+        talks = [macros.Talk(title="Indexing", slug="indexing", link="talks/indexing.md", tags=["Index", "SQL"])]
+        taxonomy = group_talks(talks)
+        path = taxonomy.src_path("tags", "Index")
+
+        self.assertNotEqual(path, "tags/index.md")
+        self.assertTrue(path.startswith("tags/index-"))
+        pages = build_taxonomy_pages(taxonomy)
+        self.assertIn("# Tags", pages["tags/index.md"])
+        self.assertIn("- [SQL](sql.md)", pages["tags/index.md"])
+        self.assertIn(f"- [Index]({Path(path).name})", pages["tags/index.md"])
+        self.assertIn(path, pages)
+
+    def test_talk_pages_link_their_terms(self) -> None:
+        taxonomy = group_talks(self.talks)
+        _, body = build_talk_page(self.talks[0], taxonomy.src_path)
+        self.assertIn("**Speakers:** [Ada Lovelace](../speakers/ada-lovelace.md)", body)
+        self.assertIn("**Topics:** [Indexes](../topics/indexes.md)", body)
+        self.assertIn("**Tags:** [SQL](../tags/sql.md)", body)
+
+        terms = render_talk_terms(taxonomy, self.talks[1], "talks/older.md")
+        self.assertIn("[Ops](../tags/ops.md)", terms)
+        self.assertTrue(terms.startswith("**Filed under:** [Ada Lovelace](../speakers/ada-lovelace.md)"))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from datetime import datetime, timezone
+
+import macros
+from lib.calendar_pages import build_month_markdown
+from lib.timeline import TimelineIndex
+
+
+def _talk(title: str, date: str, time: str = "12:00", tz: str = "UTC") -> macros.Talk:
+    return macros._decorate(macros.Talk(title=title, slug=title.lower(), date=date, time=time, timezone=tz))
+
+
+class TimelineIndexTest(unittest.TestCase):
+    """Checks for the bisect-based timeline index and calendar pages."""
+
+    def setUp(self) -> None:
+        self.talks = [
+            _talk("April", "2024-04-02"),
+            _talk("March", "2024-03-15"),
+            _talk("LateMarch", "2024-03-31", "22:00", "America/New_York"),
+            macros.Talk(title="Undated"),
+            _talk("February", "2024-02-29"),
+        ]
+        self.index = TimelineIndex(self.talks)
+
+    def test_sorted_with_undated_aside(self) -> None:
+        self.assertEqual([talk.title for talk in self.index.talks], ["February", "March", "LateMarch", "April"])
+        self.assertEqual([talk.title for talk in self.index.undated], ["Undated"])
+
+    def test_between_is_half_open(self) -> None:
+        start = datetime(2024, 3, 15, 12, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 4, 2, 12, 0, tzinfo=timezone.utc)
+        self.assertEqual([talk.title for talk in self.index.between(start, end)], ["March", "LateMarch"])
+
+    def test_in_month_uses_local_dates(self) -> None:
+        self.assertEqual([talk.title for talk in self.index.in_month(2024, 3)], ["March", "LateMarch"])
+        self.assertEqual([talk.title for talk in self.index.in_month(2024, 4)], ["April"])
+        self.assertEqual(self.index.months(), [(2024, 2), (2024, 3), (2024, 4)])
+
+    def test_since_and_before_split_on_instant(self) -> None:
+        now = datetime(2024, 3, 20, tzinfo=timezone.utc)
+        self.assertEqual([talk.title for talk in self.index.before(now)], ["February", "March"])
+        self.assertEqual([talk.title for talk in self.index.since(now)], ["LateMarch", "April"])
+
+    def test_month_page_links_neighbours(self) -> None:
+        content = build_month_markdown(2024, 3, self.index, self.index.months())
+        self.assertIn("# March 2024", content)
+        self.assertIn("(../talks/march.md)", content)
+        self.assertIn("(2024-02.md)", content)
+        self.assertIn("(2024-04.md)", content)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()